@@ -18,3 +18,45 @@ WHERE retry_count IS NULL OR max_retries IS NULL;
 -- Add comments to document the new columns
 COMMENT ON COLUMN processing_jobs.retry_count IS 'Number of times this job has been retried';
 COMMENT ON COLUMN processing_jobs.max_retries IS 'Maximum number of retries allowed for this job';
+
+-- Migration: Move chapter transcript segments into transcript_segments
+-- Description: Store segments as rows so the transcriber can bulk-load them with COPY instead of
+-- rewriting a JSONB array per chapter
+
+CREATE TABLE IF NOT EXISTS transcript_segments (
+    chapter_id UUID NOT NULL REFERENCES chapter_transcripts(chapter_id) ON DELETE CASCADE,
+    audiobook_id UUID NOT NULL REFERENCES audiobooks(id) ON DELETE CASCADE,
+    idx INTEGER NOT NULL,
+    start_ts DOUBLE PRECISION NOT NULL,
+    end_ts DOUBLE PRECISION NOT NULL,
+    text TEXT NOT NULL,
+    confidence REAL,
+    speaker INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (chapter_id, idx)
+);
+
+CREATE INDEX IF NOT EXISTS idx_transcript_segments_audiobook_id ON transcript_segments(audiobook_id);
+
+ALTER TABLE transcript_segments ENABLE ROW LEVEL SECURITY;
+
+-- Copy existing segments across, then drop the JSONB column
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'chapter_transcripts' AND column_name = 'segments'
+    ) THEN
+        INSERT INTO transcript_segments (chapter_id, audiobook_id, idx, start_ts, end_ts, text, confidence, speaker)
+        SELECT ct.chapter_id, ct.audiobook_id, s.ordinality - 1,
+               (s.value->>'start')::double precision, (s.value->>'end')::double precision, s.value->>'text',
+               (s.value->>'confidence')::real, COALESCE((s.value->>'speaker')::integer, 0)
+        FROM chapter_transcripts ct
+        CROSS JOIN LATERAL jsonb_array_elements(ct.segments) WITH ORDINALITY AS s(value, ordinality)
+        WHERE jsonb_typeof(ct.segments) = 'array'
+        ON CONFLICT DO NOTHING;
+
+        ALTER TABLE chapter_transcripts DROP COLUMN segments;
+    END IF;
+END $$;
+
+COMMENT ON TABLE transcript_segments IS 'Word-level transcript segments of a chapter, ordered by idx';
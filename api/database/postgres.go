@@ -1073,9 +1073,15 @@ func (p *PostgresRepository) CreateChapterTranscript(ctx context.Context, transc
 
 func (p *PostgresRepository) GetChapterTranscriptByChapterID(ctx context.Context, chapterID uuid.UUID) (*models.ChapterTranscript, error) {
 	query := `
-		SELECT id, chapter_id, content, segments, language, confidence_score, processing_time_seconds, created_at
-		FROM chapter_transcripts
-		WHERE chapter_id = $1
+		SELECT ct.id, ct.chapter_id, ct.content,
+		       (SELECT json_agg(json_build_object(
+		           'start', s.start_ts, 'end', s.end_ts, 'text', s.text,
+		           'confidence', s.confidence, 'speaker', s.speaker
+		       ) ORDER BY s.idx)
+		        FROM transcript_segments s WHERE s.chapter_id = ct.chapter_id) AS segments,
+		       ct.language, ct.confidence_score, ct.processing_time_seconds, ct.created_at
+		FROM chapter_transcripts ct
+		WHERE ct.chapter_id = $1
 	`
 
 	var transcript models.ChapterTranscript
@@ -78,7 +78,6 @@ CREATE TABLE IF NOT EXISTS chapter_transcripts (
     chapter_id UUID NOT NULL REFERENCES chapters(id) ON DELETE CASCADE,
     audiobook_id UUID NOT NULL REFERENCES audiobooks(id) ON DELETE CASCADE,
     content TEXT NOT NULL,
-    segments JSONB,
     language VARCHAR(10),
     confidence_score DECIMAL(3,2),
     processing_time_seconds INTEGER,
@@ -86,6 +85,19 @@ CREATE TABLE IF NOT EXISTS chapter_transcripts (
     UNIQUE(chapter_id)
 );
 
+-- Transcript Segments table (one row per transcribed word, in order)
+CREATE TABLE IF NOT EXISTS transcript_segments (
+    chapter_id UUID NOT NULL REFERENCES chapter_transcripts(chapter_id) ON DELETE CASCADE,
+    audiobook_id UUID NOT NULL REFERENCES audiobooks(id) ON DELETE CASCADE,
+    idx INTEGER NOT NULL,
+    start_ts DOUBLE PRECISION NOT NULL,
+    end_ts DOUBLE PRECISION NOT NULL,
+    text TEXT NOT NULL,
+    confidence REAL,
+    speaker INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (chapter_id, idx)
+);
+
 -- AI Outputs table
 CREATE TABLE IF NOT EXISTS ai_outputs (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -140,6 +152,9 @@ CREATE INDEX IF NOT EXISTS idx_chapters_chapter_number ON chapters(chapter_numbe
 CREATE INDEX IF NOT EXISTS idx_chapter_transcripts_chapter_id ON chapter_transcripts(chapter_id);
 CREATE INDEX IF NOT EXISTS idx_chapter_transcripts_audiobook_id ON chapter_transcripts(audiobook_id);
 
+-- Transcript Segments indexes
+CREATE INDEX IF NOT EXISTS idx_transcript_segments_audiobook_id ON transcript_segments(audiobook_id);
+
 -- AI Outputs indexes
 CREATE INDEX IF NOT EXISTS idx_ai_outputs_audiobook_id ON ai_outputs(audiobook_id);
 CREATE INDEX IF NOT EXISTS idx_ai_outputs_output_type ON ai_outputs(output_type);
@@ -186,6 +201,7 @@ CREATE TRIGGER update_upload_files_updated_at BEFORE UPDATE ON upload_files
 ALTER TABLE audiobooks ENABLE ROW LEVEL SECURITY;
 ALTER TABLE chapters ENABLE ROW LEVEL SECURITY;
 ALTER TABLE chapter_transcripts ENABLE ROW LEVEL SECURITY;
+ALTER TABLE transcript_segments ENABLE ROW LEVEL SECURITY;
 ALTER TABLE ai_outputs ENABLE ROW LEVEL SECURITY;
 ALTER TABLE processing_jobs ENABLE ROW LEVEL SECURITY;
 ALTER TABLE tags ENABLE ROW LEVEL SECURITY;
@@ -323,7 +339,7 @@ COMMENT ON TABLE audiobooks IS 'Audiobooks table. When deleted, cascades to: cha
 
 COMMENT ON TABLE uploads IS 'Uploads table. When deleted, cascades to: upload_files and chapters (via upload_file_id).';
 
-COMMENT ON TABLE chapters IS 'Chapters table. When deleted, cascades to: chapter_transcripts and chapter_ai_outputs. References both audiobook_id and upload_file_id for proper tracking and cleanup.';
+COMMENT ON TABLE chapters IS 'Chapters table. When deleted, cascades to: chapter_transcripts (and their transcript_segments) and chapter_ai_outputs. References both audiobook_id and upload_file_id for proper tracking and cleanup.';
 
 COMMENT ON COLUMN chapters.upload_file_id IS 'References the upload file that created this chapter. Allows tracking and cascading deletes from upload_files.';
 
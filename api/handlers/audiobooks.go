@@ -1423,6 +1423,15 @@ func (h *Handler) GetJobStatus(c *fiber.Ctx) error {
 	})
 }
 
+// jobStatusUpdateRequest is a job status update reported by the workers
+type jobStatusUpdateRequest struct {
+	Status       models.JobStatus `json:"status" validate:"required"`
+	ErrorMessage *string          `json:"error_message,omitempty"`
+	StartedAt    *time.Time       `json:"started_at,omitempty"`
+	CompletedAt  *time.Time       `json:"completed_at,omitempty"`
+	RetryCount   *int             `json:"retry_count,omitempty"`
+}
+
 // UpdateJobStatus updates the status of a processing job (called by workers)
 // POST /v1/admin/jobs/{job_id}/status
 func (h *Handler) UpdateJobStatus(c *fiber.Ctx) error {
@@ -1433,26 +1442,105 @@ func (h *Handler) UpdateJobStatus(c *fiber.Ctx) error {
 		})
 	}
 
+	var req jobStatusUpdateRequest
+	if err := c.BodyParser(&req); err != nil {
+		return c.Status(http.StatusBadRequest).JSON(fiber.Map{
+			"error": "Invalid request body",
+		})
+	}
+
+	job, statusCode, errMessage := h.applyJobStatusUpdate(jobID, req)
+	if job == nil {
+		return c.Status(statusCode).JSON(fiber.Map{
+			"error": errMessage,
+		})
+	}
+
+	// Check and update audiobook status
+	if err := h.repo.CheckAndUpdateAudioBookStatus(context.Background(), job.AudiobookID); err != nil {
+		// Log error but don't fail the request
+		fmt.Printf("Failed to update audiobook status: %v\n", err)
+	}
+
+	return c.JSON(fiber.Map{
+		"job_id":  jobID,
+		"status":  req.Status,
+		"message": "Job status updated successfully",
+	})
+}
+
+// UpdateJobStatuses applies several job status updates in one request (called by workers)
+// POST /internal/jobs/status
+func (h *Handler) UpdateJobStatuses(c *fiber.Ctx) error {
 	var req struct {
-		Status       models.JobStatus `json:"status" validate:"required"`
-		ErrorMessage *string          `json:"error_message,omitempty"`
-		StartedAt    *time.Time       `json:"started_at,omitempty"`
-		CompletedAt  *time.Time       `json:"completed_at,omitempty"`
-		RetryCount   *int             `json:"retry_count,omitempty"`
+		Updates []struct {
+			JobID string `json:"job_id"`
+			jobStatusUpdateRequest
+		} `json:"updates"`
 	}
 
-	if err := c.BodyParser(&req); err != nil {
+	if err := c.BodyParser(&req); err != nil || len(req.Updates) == 0 {
 		return c.Status(http.StatusBadRequest).JSON(fiber.Map{
 			"error": "Invalid request body",
 		})
 	}
 
+	// Updates are applied in order; each audiobook's status is refreshed once at the end
+	results := make([]fiber.Map, 0, len(req.Updates))
+	var audiobookIDs []uuid.UUID
+	seenAudiobooks := make(map[uuid.UUID]bool)
+
+	for _, update := range req.Updates {
+		jobID, err := uuid.Parse(update.JobID)
+		if err != nil {
+			results = append(results, fiber.Map{
+				"job_id": update.JobID,
+				"error":  "Invalid job ID",
+			})
+			continue
+		}
+
+		job, _, errMessage := h.applyJobStatusUpdate(jobID, update.jobStatusUpdateRequest)
+		if job == nil {
+			results = append(results, fiber.Map{
+				"job_id": jobID,
+				"error":  errMessage,
+			})
+			continue
+		}
+
+		if !seenAudiobooks[job.AudiobookID] {
+			seenAudiobooks[job.AudiobookID] = true
+			audiobookIDs = append(audiobookIDs, job.AudiobookID)
+		}
+
+		results = append(results, fiber.Map{
+			"job_id": jobID,
+			"status": update.Status,
+		})
+	}
+
+	// Check and update audiobook status
+	for _, audiobookID := range audiobookIDs {
+		if err := h.repo.CheckAndUpdateAudioBookStatus(context.Background(), audiobookID); err != nil {
+			// Log error but don't fail the request
+			fmt.Printf("Failed to update audiobook status: %v\n", err)
+		}
+	}
+
+	return c.JSON(fiber.Map{
+		"data":    results,
+		"message": "Job statuses updated",
+	})
+}
+
+// applyJobStatusUpdate applies a status update to a processing job. When the update cannot be
+// applied it returns a nil job with the HTTP status code and error message to report.
+func (h *Handler) applyJobStatusUpdate(jobID uuid.UUID, req jobStatusUpdateRequest) (*models.ProcessingJob, int, string) {
 	// Get the job
 	job, err := h.repo.GetProcessingJobByID(context.Background(), jobID)
 	if err != nil {
-		return c.Status(http.StatusNotFound).JSON(fiber.Map{
-			"error": "Job not found",
-		})
+		return nil, http.StatusNotFound, "Job not found"
 	}
 
 	// If status is failed and retry count is provided, increment it
@@ -1479,22 +1567,10 @@ func (h *Handler) UpdateJobStatus(c *fiber.Ctx) error {
 	fmt.Println("job retry count after increment", job.RetryCount)
 
 	if err := h.repo.UpdateProcessingJob(context.Background(), job); err != nil {
-		return c.Status(http.StatusInternalServerError).JSON(fiber.Map{
-			"error": "Failed to update job status",
-		})
-	}
-
-	// Check and update audiobook status
-	if err := h.repo.CheckAndUpdateAudioBookStatus(context.Background(), job.AudiobookID); err != nil {
-		// Log error but don't fail the request
-		fmt.Printf("Failed to update audiobook status: %v\n", err)
+		return nil, http.StatusInternalServerError, "Failed to update job status"
 	}
 
-	return c.JSON(fiber.Map{
-		"job_id":  jobID,
-		"status":  req.Status,
-		"message": "Job status updated successfully",
-	})
+	return job, http.StatusOK, ""
 }
 
 // UpdateAudioBookPrice updates the price of an audiobook (admin only)
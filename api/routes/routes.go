@@ -91,5 +91,6 @@ func SetupInternalRoutes(router fiber.Router, cfg *config.Config, h *handlers.Ha
 	router.Post("/audiobooks/:id/trigger-summarize-tag", h.TriggerSummarizeAndTagJobs)
 
 	// Internal job status updates
+	router.Post("/jobs/status", h.UpdateJobStatuses)
 	router.Post("/jobs/:job_id/status", h.UpdateJobStatus)
 }
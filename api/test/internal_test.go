@@ -295,6 +295,159 @@ func TestInternalUpdateJobStatus(t *testing.T) {
 	}
 }
 
+// TestInternalUpdateJobStatuses tests the internal batch job status update endpoint
+func TestInternalUpdateJobStatuses(t *testing.T) {
+	audiobookID := uuid.New()
+	firstJobID := uuid.New()
+	secondJobID := uuid.New()
+	missingJobID := uuid.New()
+	failingJobID := uuid.New()
+
+	tests := []struct {
+		name            string
+		requestBody     map[string]interface{}
+		setupMock       func(*MockRepository)
+		expectedStatus  int
+		expectedResults []map[string]interface{}
+	}{
+		{
+			name: "successful batch update refreshes each audiobook once",
+			requestBody: map[string]interface{}{
+				"updates": []map[string]interface{}{
+					{"job_id": firstJobID.String(), "status": "completed"},
+					{"job_id": secondJobID.String(), "status": "failed", "error_message": "Rev.ai job failed"},
+				},
+			},
+			setupMock: func(mockRepo *MockRepository) {
+				mockRepo.On("GetProcessingJobByID", mock.Anything, firstJobID).Return(&models.ProcessingJob{
+					ID:          firstJobID,
+					AudiobookID: audiobookID,
+					JobType:     models.JobTypeTranscribe,
+					Status:      models.JobStatusRunning,
+				}, nil)
+				mockRepo.On("GetProcessingJobByID", mock.Anything, secondJobID).Return(&models.ProcessingJob{
+					ID:          secondJobID,
+					AudiobookID: audiobookID,
+					JobType:     models.JobTypeTranscribe,
+					Status:      models.JobStatusRunning,
+				}, nil)
+				mockRepo.On("UpdateProcessingJob", mock.Anything, mock.AnythingOfType("*models.ProcessingJob")).Return(nil).Twice()
+				mockRepo.On("CheckAndUpdateAudioBookStatus", mock.Anything, audiobookID).Return(nil).Once()
+			},
+			expectedStatus: http.StatusOK,
+			expectedResults: []map[string]interface{}{
+				{"job_id": firstJobID.String(), "status": "completed"},
+				{"job_id": secondJobID.String(), "status": "failed"},
+			},
+		},
+		{
+			name: "invalid and missing jobs are reported per update",
+			requestBody: map[string]interface{}{
+				"updates": []map[string]interface{}{
+					{"job_id": "invalid-uuid", "status": "completed"},
+					{"job_id": missingJobID.String(), "status": "completed"},
+				},
+			},
+			setupMock: func(mockRepo *MockRepository) {
+				mockRepo.On("GetProcessingJobByID", mock.Anything, missingJobID).Return(nil, fmt.Errorf("not found"))
+			},
+			expectedStatus: http.StatusOK,
+			expectedResults: []map[string]interface{}{
+				{"job_id": "invalid-uuid", "error": "Invalid job ID"},
+				{"job_id": missingJobID.String(), "error": "Job not found"},
+			},
+		},
+		{
+			name: "failed update does not stop the rest of the batch",
+			requestBody: map[string]interface{}{
+				"updates": []map[string]interface{}{
+					{"job_id": failingJobID.String(), "status": "completed"},
+					{"job_id": firstJobID.String(), "status": "completed"},
+				},
+			},
+			setupMock: func(mockRepo *MockRepository) {
+				mockRepo.On("GetProcessingJobByID", mock.Anything, failingJobID).Return(&models.ProcessingJob{
+					ID:          failingJobID,
+					AudiobookID: audiobookID,
+					JobType:     models.JobTypeTranscribe,
+					Status:      models.JobStatusRunning,
+				}, nil)
+				mockRepo.On("GetProcessingJobByID", mock.Anything, firstJobID).Return(&models.ProcessingJob{
+					ID:          firstJobID,
+					AudiobookID: audiobookID,
+					JobType:     models.JobTypeTranscribe,
+					Status:      models.JobStatusRunning,
+				}, nil)
+				mockRepo.On("UpdateProcessingJob", mock.Anything, mock.MatchedBy(func(job *models.ProcessingJob) bool {
+					return job.ID == failingJobID
+				})).Return(fmt.Errorf("database error"))
+				mockRepo.On("UpdateProcessingJob", mock.Anything, mock.MatchedBy(func(job *models.ProcessingJob) bool {
+					return job.ID == firstJobID
+				})).Return(nil)
+				mockRepo.On("CheckAndUpdateAudioBookStatus", mock.Anything, audiobookID).Return(nil).Once()
+			},
+			expectedStatus: http.StatusOK,
+			expectedResults: []map[string]interface{}{
+				{"job_id": failingJobID.String(), "error": "Failed to update job status"},
+				{"job_id": firstJobID.String(), "status": "completed"},
+			},
+		},
+		{
+			name: "empty batch",
+			requestBody: map[string]interface{}{
+				"updates": []map[string]interface{}{},
+			},
+			setupMock: func(mockRepo *MockRepository) {
+				// No mock setup needed
+			},
+			expectedStatus: http.StatusBadRequest,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			// Setup
+			app := createTestApp()
+			handler, mockRepo := createTestHandler()
+			tt.setupMock(mockRepo)
+
+			// Create request body
+			requestBody, _ := json.Marshal(tt.requestBody)
+			req := httptest.NewRequest("POST", "/internal/jobs/status", bytes.NewReader(requestBody))
+			req.Header.Set("Content-Type", "application/json")
+
+			app.Post("/internal/jobs/status", handler.UpdateJobStatuses)
+
+			// Execute request
+			resp, err := app.Test(req)
+			assert.NoError(t, err)
+			defer resp.Body.Close()
+
+			// Assertions
+			assert.Equal(t, tt.expectedStatus, resp.StatusCode)
+
+			var response map[string]interface{}
+			err = json.NewDecoder(resp.Body).Decode(&response)
+			assert.NoError(t, err)
+
+			if tt.expectedStatus == http.StatusOK {
+				results, ok := response["data"].([]interface{})
+				assert.True(t, ok)
+				assert.Len(t, results, len(tt.expectedResults))
+				for i, expected := range tt.expectedResults {
+					if i < len(results) {
+						assert.Equal(t, expected, results[i])
+					}
+				}
+			} else {
+				assert.Contains(t, response, "error")
+			}
+
+			mockRepo.AssertExpectations(t)
+		})
+	}
+}
+
 // TestInternalAPIKeyMiddleware tests the internal API key middleware behavior
 // Note: This is a conceptual test - actual middleware testing would require the middleware setup
 func TestInternalAPIKeyMiddleware(t *testing.T) {
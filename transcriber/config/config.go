@@ -3,6 +3,7 @@ package config
 import (
 	"fmt"
 	"os"
+	"strconv"
 )
 
 // Config holds all configuration for the transcriber service
@@ -19,13 +20,25 @@ type Config struct {
 	InternalAPIKey string
 
 	// Rev.ai
-	RevAIAPIKey string
-	RevAIURL    string
+	RevAIAPIKey          string
+	RevAIURL             string
+	RevAITranscriber     string
+	RevAILanguage        string
+	RevAICallbackURL     string
+	RevAISkipDiarization bool
+
+	// Callback server
+	CallbackPort string
 
 	// Processing
 	MaxConcurrentJobs int
+	Concurrency       int // number of queue consumers sharing MaxConcurrentJobs
 	JobPollInterval   int // seconds
 	JobTimeout        int // seconds
+
+	// Profiling
+	CPUProfile        string
+	CPUProfileSeconds int
 }
 
 // New creates a new Config instance
@@ -43,13 +56,25 @@ func New() *Config {
 		InternalAPIKey: getEnv("INTERNAL_API_KEY", ""),
 
 		// Rev.ai
-		RevAIAPIKey: getEnv("REV_AI_API_KEY", ""),
-		RevAIURL:    getEnv("REV_AI_URL", "https://api.rev.ai/speechtotext/v1"),
+		RevAIAPIKey:          getEnv("REV_AI_API_KEY", ""),
+		RevAIURL:             getEnv("REV_AI_URL", "https://api.rev.ai/speechtotext/v1"),
+		RevAITranscriber:     getEnv("REV_AI_TRANSCRIBER", "machine"), // "machine", "low_cost" or "fusion"
+		RevAILanguage:        getEnv("REV_AI_LANGUAGE", "en"),
+		RevAICallbackURL:     getEnv("REV_AI_CALLBACK_URL", ""),             // e.g. https://transcriber.example.com/revai/callback
+		RevAISkipDiarization: getEnvAsBool("REV_AI_SKIP_DIARIZATION", true), // audiobooks have a single narrator
+
+		// Callback server
+		CallbackPort: getEnv("CALLBACK_PORT", "8080"),
 
 		// Processing
 		MaxConcurrentJobs: getEnvAsInt("MAX_CONCURRENT_JOBS", 5),
+		Concurrency:       getEnvAsInt("CONCURRENCY", 3),
 		JobPollInterval:   getEnvAsInt("JOB_POLL_INTERVAL", 5),
 		JobTimeout:        getEnvAsInt("JOB_TIMEOUT", 1800), // 30 minutes
+
+		// Profiling
+		CPUProfile:        getEnv("CPU_PROFILE", ""),
+		CPUProfileSeconds: getEnvAsInt("CPU_PROFILE_SECONDS", 300),
 	}
 }
 
@@ -71,6 +96,16 @@ func getEnvAsInt(key string, defaultValue int) int {
 	return defaultValue
 }
 
+// getEnvAsBool gets an environment variable as boolean or returns a default value
+func getEnvAsBool(key string, defaultValue bool) bool {
+	if value := os.Getenv(key); value != "" {
+		if boolValue, err := strconv.ParseBool(value); err == nil {
+			return boolValue
+		}
+	}
+	return defaultValue
+}
+
 // parseInt is a helper function to parse string to int
 func parseInt(s string) (int, error) {
 	var i int
@@ -86,5 +121,13 @@ func (c *Config) Validate() error {
 	if c.RevAIAPIKey == "" {
 		return fmt.Errorf("REV_AI_API_KEY is required")
 	}
+	switch c.RevAITranscriber {
+	case "machine", "low_cost", "fusion":
+	default:
+		return fmt.Errorf("REV_AI_TRANSCRIBER must be one of machine, low_cost or fusion, got %q", c.RevAITranscriber)
+	}
+	if c.CPUProfile != "" && c.CPUProfileSeconds <= 0 {
+		return fmt.Errorf("CPU_PROFILE_SECONDS must be positive when CPU_PROFILE is set, got %d", c.CPUProfileSeconds)
+	}
 	return nil
 }
@@ -1,14 +1,14 @@
 package main
 
 import (
-	"bytes"
 	"context"
-	"encoding/json"
 	"fmt"
 	"log"
 	"net/http"
 	"os"
 	"os/signal"
+	"runtime/pprof"
+	"sync"
 	"syscall"
 	"time"
 
@@ -31,6 +31,16 @@ func main() {
 		log.Fatalf("Configuration error: %v", err)
 	}
 
+	// Record a CPU profile for profile-guided optimization when requested. Copying the
+	// profile to default.pgo makes the next build optimize for the observed hot paths.
+	if cfg.CPUProfile != "" {
+		stopProfile, err := startCPUProfile(cfg.CPUProfile, time.Duration(cfg.CPUProfileSeconds)*time.Second)
+		if err != nil {
+			log.Fatalf("Failed to start CPU profile: %v", err)
+		}
+		defer stopProfile()
+	}
+
 	// Initialize database service
 	dbService, err := services.NewDatabaseService(cfg.DatabaseURL)
 	if err != nil {
@@ -39,11 +49,22 @@ func main() {
 	defer dbService.Close()
 
 	// Initialize Rev.ai service
-	revAIService := services.NewRevAIService(cfg.RevAIAPIKey, cfg.RevAIURL)
+	revAIService := services.NewRevAIService(cfg.RevAIAPIKey, cfg.RevAIURL, services.RevAIOptions{
+		Transcriber:     cfg.RevAITranscriber,
+		Language:        cfg.RevAILanguage,
+		CallbackURL:     cfg.RevAICallbackURL,
+		SkipDiarization: cfg.RevAISkipDiarization,
+	})
+
+	// Open the Rev.ai connection ahead of the first job
+	if err := revAIService.WarmUp(); err != nil {
+		log.Printf("Warning: Rev.ai warm-up failed: %v", err)
+	}
 
 	// Initialize Redis consumer
 	redisConsumer, err := services.NewRedisConsumer(cfg.RedisURL, "audiobooks", &services.Config{
 		MaxConcurrentJobs: cfg.MaxConcurrentJobs,
+		Consumers:         cfg.Concurrency,
 		JobPollInterval:   cfg.JobPollInterval,
 		JobTimeout:        cfg.JobTimeout,
 	})
@@ -62,12 +83,11 @@ func main() {
 	}
 
 	// Initialize worker
-	worker := services.NewWorker(dbService, revAIService, workerConfig)
+	worker := services.NewWorker(dbService, revAIService, redisConsumer, workerConfig)
 
-	// Create HTTP client for status updates
-	httpClient := &http.Client{
-		Timeout: 30 * time.Second,
-	}
+	// Send status updates to the API in the background
+	statusUpdater := services.NewStatusUpdater(services.NewHTTPClient(30*time.Second), cfg.APIBaseURL, cfg.InternalAPIKey, 4*cfg.MaxConcurrentJobs)
+	defer statusUpdater.Close()
 
 	// Create context for graceful shutdown
 	ctx, cancel := context.WithCancel(context.Background())
@@ -83,108 +103,139 @@ func main() {
 		cancel()
 	}()
 
-	// Start consuming transcription jobs from Redis
-	log.Println("Starting transcriber service...")
-	if err := redisConsumer.ConsumeJobs(ctx, "transcribe", func(message services.JobMessage, currentRetryCount int) error {
-		return processTranscriptionJob(worker, httpClient, cfg.APIBaseURL, cfg.InternalAPIKey, message, currentRetryCount)
-	}); err != nil {
+	// Receive Rev.ai completion callbacks instead of polling every job
+	if cfg.RevAICallbackURL != "" {
+		mux := http.NewServeMux()
+		mux.HandleFunc("/revai/callback", revAIService.HandleCallback)
+		callbackServer := &http.Server{
+			Addr:    ":" + cfg.CallbackPort,
+			Handler: mux,
+		}
+
+		go func() {
+			log.Printf("Listening for Rev.ai callbacks on port %s", cfg.CallbackPort)
+			if err := callbackServer.ListenAndServe(); err != nil && err != http.ErrServerClosed {
+				log.Printf("Callback server error: %v", err)
+			}
+		}()
+
+		go func() {
+			<-ctx.Done()
+			shutdownCtx, shutdownCancel := context.WithTimeout(context.Background(), 5*time.Second)
+			defer shutdownCancel()
+			callbackServer.Shutdown(shutdownCtx)
+		}()
+	}
+
+	// Start consuming transcription jobs from Redis. Every consumer claims its own batches and
+	// shares the worker, Rev.ai client and connection pools, so a slow job only holds back the
+	// batch it was claimed with.
+	batchSizes := redisConsumer.BatchSizes()
+	log.Printf("Starting transcriber service with %d consumers (batch sizes %v)...", len(batchSizes), batchSizes)
+
+	consumerErrs := make(chan error, len(batchSizes))
+	var wg sync.WaitGroup
+	for _, batchSize := range batchSizes {
+		wg.Add(1)
+		go func(batchSize int) {
+			defer wg.Done()
+			if err := redisConsumer.ConsumeJobs(ctx, "transcribe", batchSize, func(messages []services.JobMessage) []error {
+				return processTranscriptionJobs(worker, statusUpdater, messages)
+			}); err != nil && err != context.Canceled {
+				consumerErrs <- err
+				cancel()
+			}
+		}(batchSize)
+	}
+	wg.Wait()
+	close(consumerErrs)
+
+	if err := <-consumerErrs; err != nil {
 		log.Fatalf("Error consuming jobs: %v", err)
 	}
 }
 
-// processTranscriptionJob processes a transcription job and updates status via HTTP
-func processTranscriptionJob(worker *services.Worker, httpClient *http.Client, apiBaseURL string, internalAPIKey string, message services.JobMessage, currentRetryCount int) error {
-	// Convert JobMessage to Job model
-	job := models.Job{
-		ID:          message.ID,
-		AudiobookID: message.AudiobookID,
-		ChapterID:   message.ChapterID,
-		JobType:     message.JobType,
-		Status:      "running",
-		RetryCount:  message.RetryCount,
-		MaxRetries:  message.MaxRetries,
-		CreatedAt:   message.CreatedAt,
+// startCPUProfile records a CPU profile to path. The profile is flushed once window has passed or
+// when the returned function is called, whichever comes first, so a later fatal exit cannot lose it.
+func startCPUProfile(path string, window time.Duration) (func(), error) {
+	profileFile, err := os.Create(path)
+	if err != nil {
+		return nil, err
 	}
 
-	// Set file path if available
-	if message.FilePath != nil {
-		job.FilePath = *message.FilePath
-	} else {
-		return fmt.Errorf("no file path provided in job message")
+	if err := pprof.StartCPUProfile(profileFile); err != nil {
+		profileFile.Close()
+		return nil, err
 	}
+	log.Printf("Writing CPU profile to %s for %s", path, window)
 
-	// fmt.Println("currentRetryCount", currentRetryCount)
-
-	// Update job status to running
-	now := time.Now()
-	updateJobStatus(httpClient, apiBaseURL, internalAPIKey, message.ID.String(), "running", "", &now, nil, 0)
-
-	// Process the job
-	if err := worker.ProcessJob(job); err != nil {
-		// Update job status to failed and pass the incremented retry count
-		now := time.Now()
-		fmt.Println("incremented retryCount", currentRetryCount)
-		updateJobStatus(httpClient, apiBaseURL, internalAPIKey, message.ID.String(), "failed", err.Error(), nil, &now, currentRetryCount)
-		return err
+	var once sync.Once
+	stop := func() {
+		once.Do(func() {
+			pprof.StopCPUProfile()
+			profileFile.Close()
+			log.Printf("CPU profile written to %s", path)
+		})
 	}
+	time.AfterFunc(window, stop)
 
-	// Update job status to completed
-	now = time.Now()
-	updateJobStatus(httpClient, apiBaseURL, internalAPIKey, message.ID.String(), "completed", "", nil, &now, 0)
-
-	log.Printf("Transcription job %s completed successfully for audiobook %s", message.ID, message.AudiobookID)
-	return nil
+	return stop, nil
 }
 
-// updateJobStatus sends job status update to the API
-func updateJobStatus(httpClient *http.Client, apiBaseURL string, internalAPIKey string, jobID string, status string, errorMessage string, startedAt, completedAt *time.Time, retryCount int) {
-	// Build the request payload
-	payload := map[string]interface{}{
-		"status": status,
-	}
+// processTranscriptionJobs processes a batch of transcription jobs and reports their status to the API
+func processTranscriptionJobs(worker *services.Worker, statusUpdater *services.StatusUpdater, messages []services.JobMessage) []error {
+	errs := make([]error, len(messages))
+	jobs := make([]models.Job, 0, len(messages))
+	jobMessages := make([]int, 0, len(messages))
+
+	for i, message := range messages {
+		// Convert JobMessage to Job model
+		job := models.Job{
+			ID:          message.ID,
+			AudiobookID: message.AudiobookID,
+			ChapterID:   message.ChapterID,
+			JobType:     message.JobType,
+			Status:      "running",
+			RetryCount:  message.RetryCount,
+			MaxRetries:  message.MaxRetries,
+			CreatedAt:   message.CreatedAt,
+		}
+
+		// Set file path if available
+		if message.FilePath != nil {
+			job.FilePath = *message.FilePath
+		} else {
+			errs[i] = fmt.Errorf("no file path provided in job message")
+			continue
+		}
+
+		// Update job status to running
+		now := time.Now()
+		statusUpdater.Update(services.JobStatusUpdate{JobID: message.ID.String(), Status: "running", StartedAt: &now})
 
-	if errorMessage != "" {
-		payload["error_message"] = errorMessage
-	}
-	if startedAt != nil {
-		payload["started_at"] = startedAt.Format(time.RFC3339)
-	}
-	if completedAt != nil {
-		payload["completed_at"] = completedAt.Format(time.RFC3339)
-	}
-	if retryCount > 0 {
-		payload["retry_count"] = retryCount
+		jobs = append(jobs, job)
+		jobMessages = append(jobMessages, i)
 	}
 
-	// Convert payload to JSON
-	jsonData, err := json.Marshal(payload)
-	if err != nil {
-		log.Printf("Error marshaling job status update: %v", err)
-		return
-	}
+	// Process the jobs
+	for n, err := range worker.ProcessJobs(jobs) {
+		i := jobMessages[n]
+		message := messages[i]
+		now := time.Now()
 
-	// Create HTTP request
-	url := fmt.Sprintf("%s/api/v1/internal/jobs/%s/status", apiBaseURL, jobID)
-	req, err := http.NewRequest("POST", url, bytes.NewBuffer(jsonData))
-	if err != nil {
-		log.Printf("Error creating job status update request: %v", err)
-		return
-	}
+		if err != nil {
+			// Update job status to failed and pass the incremented retry count
+			fmt.Println("incremented retryCount", message.RetryCount)
+			statusUpdater.Update(services.JobStatusUpdate{JobID: message.ID.String(), Status: "failed", ErrorMessage: err.Error(), CompletedAt: &now, RetryCount: message.RetryCount})
+			errs[i] = err
+			continue
+		}
 
-	req.Header.Set("Content-Type", "application/json")
-	req.Header.Set("X-Internal-API-Key", internalAPIKey)
+		// Update job status to completed
+		statusUpdater.Update(services.JobStatusUpdate{JobID: message.ID.String(), Status: "completed", CompletedAt: &now})
 
-	// Send request
-	resp, err := httpClient.Do(req)
-	if err != nil {
-		log.Printf("Error sending job status update: %v", err)
-		return
+		log.Printf("Transcription job %s completed successfully for audiobook %s", message.ID, message.AudiobookID)
 	}
-	defer resp.Body.Close()
 
-	if resp.StatusCode != http.StatusOK {
-		log.Printf("Job status update failed with status: %d", resp.StatusCode)
-	} else {
-		log.Printf("Job %s status updated successfully: %s", jobID, status)
-	}
+	return errs
 }
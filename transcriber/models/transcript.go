@@ -30,9 +30,13 @@ type Segment struct {
 
 // RevAIJob represents a Rev.ai job submission
 type RevAIJob struct {
-	MediaURL    string `json:"media_url,omitempty"`
-	Metadata    string `json:"metadata,omitempty"`
-	CallbackURL string `json:"callback_url,omitempty"`
+	MediaURL        string `json:"media_url,omitempty"`
+	Metadata        string `json:"metadata,omitempty"`
+	CallbackURL     string `json:"callback_url,omitempty"`
+	Transcriber     string `json:"transcriber,omitempty"`
+	Language        string `json:"language,omitempty"`
+	SkipDiarization bool   `json:"skip_diarization,omitempty"`
+	SkipPunctuation bool   `json:"skip_punctuation,omitempty"`
 }
 
 // RevAIJobResponse represents the response from Rev.ai job creation
@@ -45,20 +49,20 @@ type RevAIJobResponse struct {
 	CallbackURL string `json:"callback_url"`
 }
 
-// RevAITranscript represents the transcript response from Rev.ai
+// RevAITranscript represents the job details returned by Rev.ai
 type RevAITranscript struct {
 	ID          string `json:"id"`
 	Status      string `json:"status"`
 	CreatedOn   string `json:"created_on"`
 	CompletedOn string `json:"completed_on"`
-	Monologues  []struct {
-		Speaker  int `json:"speaker"`
-		Elements []struct {
-			Type       string  `json:"type"`
-			Value      string  `json:"value"`
-			StartTs    float64 `json:"start_ts"`
-			EndTs      float64 `json:"end_ts"`
-			Confidence float64 `json:"confidence"`
-		} `json:"elements"`
-	} `json:"monologues"`
+	Language    string `json:"language,omitempty"`
+}
+
+// RevAIElement represents a single element of a Rev.ai transcript monologue
+type RevAIElement struct {
+	Type       string  `json:"type"`
+	Value      string  `json:"value"`
+	StartTs    float64 `json:"start_ts"`
+	EndTs      float64 `json:"end_ts"`
+	Confidence float64 `json:"confidence"`
 }
@@ -2,10 +2,8 @@ package services
 
 import (
 	"context"
-	"encoding/json"
 	"fmt"
 	"log"
-	"time"
 
 	"audio-book-ai/transcriber/models"
 
@@ -19,27 +17,75 @@ type DatabaseService struct {
 	pool *pgxpool.Pool
 }
 
+// Names of the statements prepared on every pooled connection. The per-job hot path executes
+// these by name so Postgres parses and plans them once per connection rather than once per job.
+const (
+	stmtSaveTranscript = "save_transcript"
+	stmtIsChapter1     = "is_chapter_1"
+)
+
+// preparedStatements maps statement names to their SQL
+var preparedStatements = map[string]string{
+	// The id and created_at columns use their server-side defaults.
+	// The chapter is resolved inside the insert itself. A missing chapter returns no row
+	// rather than raising, which would abort every other transcript saved with it.
+	// Segments from an earlier save of the chapter are cleared so they can be reloaded with COPY.
+	stmtSaveTranscript: `
+		WITH saved AS (
+			INSERT INTO chapter_transcripts (
+				chapter_id, audiobook_id, content, language, 
+				confidence_score, processing_time_seconds
+			)
+			SELECT c.id, c.audiobook_id, $3::text, $4::varchar,
+			       $5::numeric, $6::integer
+			FROM chapters c
+			WHERE c.audiobook_id = $1 AND c.file_path = $2
+			LIMIT 1
+			ON CONFLICT (chapter_id) DO UPDATE SET
+				content = EXCLUDED.content,
+				language = EXCLUDED.language,
+				confidence_score = EXCLUDED.confidence_score,
+				processing_time_seconds = EXCLUDED.processing_time_seconds,
+				created_at = EXCLUDED.created_at
+			RETURNING chapter_id
+		), cleared AS (
+			DELETE FROM transcript_segments
+			WHERE chapter_id IN (SELECT chapter_id FROM saved)
+		)
+		SELECT chapter_id FROM saved
+	`,
+	stmtIsChapter1: `
+		SELECT chapter_number FROM chapters 
+		WHERE id = $1
+	`,
+}
+
 // NewDatabaseService creates a new database service
 func NewDatabaseService(dbURL string) (*DatabaseService, error) {
-	// First, test the connection with pgx.Connect to handle early fallback gracefully
-	conn, err := pgx.Connect(context.Background(), dbURL)
+	poolConfig, err := pgxpool.ParseConfig(dbURL)
 	if err != nil {
-		return nil, fmt.Errorf("failed to connect to database: %v", err)
+		return nil, fmt.Errorf("failed to parse database URL: %v", err)
 	}
-	defer conn.Close(context.Background())
 
-	// Test database connection
-	if err := conn.Ping(context.Background()); err != nil {
-		return nil, fmt.Errorf("failed to ping database: %v", err)
+	// Keep a connection open between jobs instead of reconnecting after idle periods
+	poolConfig.MinConns = 1
+
+	// Prepare the hot statements once on every new connection
+	poolConfig.AfterConnect = func(ctx context.Context, conn *pgx.Conn) error {
+		for name, sql := range preparedStatements {
+			if _, err := conn.Prepare(ctx, name, sql); err != nil {
+				return fmt.Errorf("failed to prepare statement %s: %v", name, err)
+			}
+		}
+		return nil
 	}
 
-	// Now create the connection pool
-	pool, err := pgxpool.New(context.Background(), dbURL)
+	pool, err := pgxpool.NewWithConfig(context.Background(), poolConfig)
 	if err != nil {
 		return nil, fmt.Errorf("failed to create connection pool: %v", err)
 	}
 
-	// Test the pool connection as well
+	// Test the pool connection, which also verifies the statements prepare cleanly
 	if err := pool.Ping(context.Background()); err != nil {
 		pool.Close()
 		return nil, fmt.Errorf("failed to ping connection pool: %v", err)
@@ -125,55 +171,147 @@ func (d *DatabaseService) UpdateJobStatus(jobID uuid.UUID, status string, errorM
 
 // SaveTranscript saves the transcript to the database
 func (d *DatabaseService) SaveTranscript(transcript *models.Transcript) error {
-	segmentsJSON, err := json.Marshal(transcript.Segments)
+	return d.SaveTranscripts([]*models.Transcript{transcript})[0]
+}
+
+// SaveTranscripts saves a batch of transcripts in one transaction and returns one error (or nil)
+// per transcript. The transcript rows are written in a single batched round trip and the segments
+// of every saved transcript are then bulk-loaded with a single COPY.
+func (d *DatabaseService) SaveTranscripts(transcripts []*models.Transcript) []error {
+	errs := make([]error, len(transcripts))
+	ctx := context.Background()
+
+	// failAll reports err for every transcript that has not already failed on its own
+	failAll := func(err error) []error {
+		for i := range errs {
+			if errs[i] == nil {
+				errs[i] = err
+			}
+		}
+		return errs
+	}
+
+	tx, err := d.pool.Begin(ctx)
 	if err != nil {
-		return fmt.Errorf("failed to marshal segments: %v", err)
+		return failAll(fmt.Errorf("failed to begin transaction: %v", err))
+	}
+	defer tx.Rollback(ctx)
+
+	batch := &pgx.Batch{}
+	for _, transcript := range transcripts {
+		batch.Queue(stmtSaveTranscript,
+			transcript.AudiobookID,
+			transcript.FilePath,
+			transcript.Content,
+			transcript.Language,
+			transcript.ConfidenceScore,
+			transcript.ProcessingTimeSeconds,
+		)
 	}
 
-	// First, get the chapter ID for this audiobook and file path
-	chapterQuery := `
-		SELECT id FROM chapters 
-		WHERE audiobook_id = $1 AND file_path = $2
-		LIMIT 1
-	`
+	chapterIDs := make([]uuid.UUID, len(transcripts))
+	results := tx.SendBatch(ctx, batch)
+	for i, transcript := range transcripts {
+		if err := results.QueryRow().Scan(&chapterIDs[i]); err != nil {
+			if err == pgx.ErrNoRows {
+				errs[i] = fmt.Errorf("failed to find chapter for audiobook %s and file path %s", transcript.AudiobookID, transcript.FilePath)
+				continue
+			}
+			results.Close()
+			return failAll(fmt.Errorf("failed to save transcript for audiobook %s and file path %s: %v", transcript.AudiobookID, transcript.FilePath, err))
+		}
+	}
+	if err := results.Close(); err != nil {
+		return failAll(fmt.Errorf("failed to save transcripts: %v", err))
+	}
 
-	var chapterID uuid.UUID
-	err = d.pool.QueryRow(context.Background(), chapterQuery, transcript.AudiobookID, transcript.FilePath).Scan(&chapterID)
-	if err != nil {
-		return fmt.Errorf("failed to find chapter for audiobook %s and file path %s: %v", transcript.AudiobookID, transcript.FilePath, err)
+	copySegments := latestPerChapter(chapterIDs, errs)
+	segments := &segmentRows{transcripts: transcripts, chapterIDs: chapterIDs, include: copySegments, segment: -1}
+	if _, err := tx.CopyFrom(ctx, pgx.Identifier{"transcript_segments"}, segmentColumns, segments); err != nil {
+		return failAll(fmt.Errorf("failed to copy transcript segments: %v", err))
 	}
 
-	query := `
-		INSERT INTO chapter_transcripts (
-			id, chapter_id, audiobook_id, content, segments, language, 
-			confidence_score, processing_time_seconds, created_at
-		) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-		ON CONFLICT (chapter_id) DO UPDATE SET
-			content = EXCLUDED.content,
-			segments = EXCLUDED.segments,
-			language = EXCLUDED.language,
-			confidence_score = EXCLUDED.confidence_score,
-			processing_time_seconds = EXCLUDED.processing_time_seconds,
-			created_at = EXCLUDED.created_at
-	`
+	if err := tx.Commit(ctx); err != nil {
+		return failAll(fmt.Errorf("failed to commit transcripts: %v", err))
+	}
 
-	_, err = d.pool.Exec(context.Background(), query,
-		uuid.New(),
-		chapterID,
-		transcript.AudiobookID,
-		transcript.Content,
-		segmentsJSON,
-		transcript.Language,
-		transcript.ConfidenceScore,
-		transcript.ProcessingTimeSeconds,
-		time.Now(),
-	)
+	for i, transcript := range transcripts {
+		if errs[i] != nil {
+			continue
+		}
+		if !copySegments[i] {
+			log.Printf("Transcript for %s in audiobook %s was superseded by a later one for chapter %s", transcript.FilePath, transcript.AudiobookID, chapterIDs[i])
+			continue
+		}
+		log.Printf("Saved transcript for %s in audiobook %s (%d segments)", transcript.FilePath, transcript.AudiobookID, len(transcript.Segments))
+	}
 
-	if err != nil {
-		return fmt.Errorf("failed to save transcript: %v", err)
+	return errs
+}
+
+// latestPerChapter reports which saved transcripts should have their segments copied. Transcripts
+// that resolve to the same chapter (a duplicate message, or chapters sharing a file path) were
+// upserted in order, so the last one owns the row. Only its segments are copied; copying the
+// others too would collide on the (chapter_id, idx) primary key.
+func latestPerChapter(chapterIDs []uuid.UUID, errs []error) []bool {
+	latest := make([]bool, len(chapterIDs))
+	lastForChapter := make(map[uuid.UUID]int, len(chapterIDs))
+	for i, chapterID := range chapterIDs {
+		if errs[i] == nil {
+			lastForChapter[chapterID] = i
+		}
+	}
+	for _, i := range lastForChapter {
+		latest[i] = true
 	}
+	return latest
+}
 
-	log.Printf("Saved transcript for chapter %s in audiobook %s", chapterID, transcript.AudiobookID)
+// segmentColumns are the transcript_segments columns filled by segmentRows, in order
+var segmentColumns = []string{"chapter_id", "audiobook_id", "idx", "start_ts", "end_ts", "text", "confidence", "speaker"}
+
+// segmentRows feeds the segments of the included transcripts to COPY one row at a time. Rows are
+// produced on demand rather than materialized up front.
+type segmentRows struct {
+	transcripts []*models.Transcript
+	chapterIDs  []uuid.UUID
+	include     []bool
+
+	transcript int // index of the current transcript
+	segment    int // index of the current segment within it
+	values     [8]any
+}
+
+func (r *segmentRows) Next() bool {
+	for r.transcript < len(r.transcripts) {
+		r.segment++
+		if r.include[r.transcript] && r.segment < len(r.transcripts[r.transcript].Segments) {
+			return true
+		}
+		r.transcript++
+		r.segment = -1
+	}
+	return false
+}
+
+func (r *segmentRows) Values() ([]any, error) {
+	transcript := r.transcripts[r.transcript]
+	segment := transcript.Segments[r.segment]
+
+	r.values = [8]any{
+		r.chapterIDs[r.transcript],
+		transcript.AudiobookID,
+		r.segment,
+		segment.Start,
+		segment.End,
+		segment.Text,
+		segment.Confidence,
+		segment.Speaker,
+	}
+	return r.values[:], nil
+}
+
+func (r *segmentRows) Err() error {
 	return nil
 }
 
@@ -199,13 +337,8 @@ func (d *DatabaseService) AreAllChaptersTranscribed(audiobookID string) (bool, e
 
 // IsChapter1 checks if the given chapter ID corresponds to chapter 1
 func (d *DatabaseService) IsChapter1(chapterID uuid.UUID) (bool, error) {
-	query := `
-		SELECT chapter_number FROM chapters 
-		WHERE id = $1
-	`
-
 	var chapterNumber int
-	err := d.pool.QueryRow(context.Background(), query, chapterID).Scan(&chapterNumber)
+	err := d.pool.QueryRow(context.Background(), stmtIsChapter1, chapterID).Scan(&chapterNumber)
 	if err != nil {
 		return false, fmt.Errorf("failed to get chapter number: %v", err)
 	}
@@ -0,0 +1,129 @@
+package services
+
+import (
+	"errors"
+	"reflect"
+	"testing"
+
+	"audio-book-ai/transcriber/models"
+
+	"github.com/google/uuid"
+)
+
+func TestSegmentRows(t *testing.T) {
+	chapterA := uuid.UUID{1}
+	chapterB := uuid.UUID{2}
+	audiobook := uuid.UUID{9}
+
+	segment := func(text string, start float64) models.Segment {
+		return models.Segment{Start: start, End: start + 0.5, Text: text, Confidence: 0.9, Speaker: 1}
+	}
+
+	// row is the subset of a COPY row checked here: chapter, idx and text
+	type row struct {
+		chapterID uuid.UUID
+		idx       int
+		text      string
+	}
+
+	tests := []struct {
+		name         string
+		transcripts  []*models.Transcript
+		chapterIDs   []uuid.UUID
+		errs         []error
+		expectedRows []row
+	}{
+		{
+			name: "segments of every saved transcript in order",
+			transcripts: []*models.Transcript{
+				{AudiobookID: audiobook, Segments: []models.Segment{segment("one", 0), segment("two", 1)}},
+				{AudiobookID: audiobook, Segments: []models.Segment{segment("three", 0)}},
+			},
+			chapterIDs: []uuid.UUID{chapterA, chapterB},
+			errs:       []error{nil, nil},
+			expectedRows: []row{
+				{chapterA, 0, "one"},
+				{chapterA, 1, "two"},
+				{chapterB, 0, "three"},
+			},
+		},
+		{
+			name: "transcripts that failed to save are excluded",
+			transcripts: []*models.Transcript{
+				{AudiobookID: audiobook, Segments: []models.Segment{segment("lost", 0)}},
+				{AudiobookID: audiobook, Segments: []models.Segment{segment("kept", 0)}},
+			},
+			chapterIDs: []uuid.UUID{{}, chapterB},
+			errs:       []error{errors.New("failed to find chapter"), nil},
+			expectedRows: []row{
+				{chapterB, 0, "kept"},
+			},
+		},
+		{
+			name: "transcripts without segments produce no rows",
+			transcripts: []*models.Transcript{
+				{AudiobookID: audiobook},
+				{AudiobookID: audiobook, Segments: []models.Segment{}},
+				{AudiobookID: audiobook, Segments: []models.Segment{segment("only", 0)}},
+			},
+			chapterIDs: []uuid.UUID{chapterA, {3}, chapterB},
+			errs:       []error{nil, nil, nil},
+			expectedRows: []row{
+				{chapterB, 0, "only"},
+			},
+		},
+		{
+			name: "only the last transcript for a chapter is copied",
+			transcripts: []*models.Transcript{
+				{AudiobookID: audiobook, Segments: []models.Segment{segment("old", 0), segment("stale", 1)}},
+				{AudiobookID: audiobook, Segments: []models.Segment{segment("other", 0)}},
+				{AudiobookID: audiobook, Segments: []models.Segment{segment("new", 0)}},
+			},
+			chapterIDs: []uuid.UUID{chapterA, chapterB, chapterA},
+			errs:       []error{nil, nil, nil},
+			expectedRows: []row{
+				{chapterB, 0, "other"},
+				{chapterA, 0, "new"},
+			},
+		},
+		{
+			name:        "empty batch",
+			transcripts: []*models.Transcript{},
+			chapterIDs:  []uuid.UUID{},
+			errs:        []error{},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			rows := &segmentRows{
+				transcripts: tt.transcripts,
+				chapterIDs:  tt.chapterIDs,
+				include:     latestPerChapter(tt.chapterIDs, tt.errs),
+				segment:     -1,
+			}
+
+			var got []row
+			for rows.Next() {
+				values, err := rows.Values()
+				if err != nil {
+					t.Fatalf("unexpected error: %v", err)
+				}
+				if len(values) != len(segmentColumns) {
+					t.Fatalf("got %d values, want one per column (%d)", len(values), len(segmentColumns))
+				}
+				if values[1] != audiobook {
+					t.Errorf("audiobook_id = %v, want %v", values[1], audiobook)
+				}
+				got = append(got, row{values[0].(uuid.UUID), values[2].(int), values[5].(string)})
+			}
+			if err := rows.Err(); err != nil {
+				t.Fatalf("unexpected error: %v", err)
+			}
+
+			if !reflect.DeepEqual(got, tt.expectedRows) {
+				t.Errorf("rows = %v, want %v", got, tt.expectedRows)
+			}
+		})
+	}
+}
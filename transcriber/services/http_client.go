@@ -0,0 +1,38 @@
+package services
+
+import (
+	"io"
+	"net/http"
+	"time"
+)
+
+// maxDrainBytes bounds how much of an unread response body is discarded to keep its connection reusable
+const maxDrainBytes = 64 << 10
+
+// sharedTransport is used by every HTTP client in the transcriber so connections to Rev.ai and the
+// API stay alive across jobs. The default transport only keeps two idle connections per host, which
+// makes concurrent Rev.ai polling re-handshake TLS on almost every request.
+var sharedTransport = newSharedTransport()
+
+func newSharedTransport() *http.Transport {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = 100
+	transport.MaxIdleConnsPerHost = 32
+	transport.IdleConnTimeout = 90 * time.Second
+	return transport
+}
+
+// NewHTTPClient creates an HTTP client with the given timeout on the shared transport
+func NewHTTPClient(timeout time.Duration) *http.Client {
+	return &http.Client{
+		Transport: sharedTransport,
+		Timeout:   timeout,
+	}
+}
+
+// CloseBody drains and closes a response body. A body closed before EOF (e.g. after json.Decoder
+// stops at the end of the value) tears down its connection instead of returning it to the pool.
+func CloseBody(body io.ReadCloser) {
+	io.CopyN(io.Discard, body, maxDrainBytes)
+	body.Close()
+}
@@ -11,6 +11,9 @@ import (
 	"github.com/redis/go-redis/v9"
 )
 
+// submissionTTL is how long a job's Rev.ai submission is remembered for reuse by retries and restarts
+const submissionTTL = 24 * time.Hour
+
 // RedisConsumer handles consuming transcription jobs from Redis queues
 type RedisConsumer struct {
 	client *redis.Client
@@ -76,13 +79,70 @@ func (r *RedisConsumer) getFailedQueueName(jobType string) string {
 	return fmt.Sprintf("%s:failed:%s", r.prefix, jobType)
 }
 
-// ConsumeJobs starts consuming transcription jobs from the queue
-func (r *RedisConsumer) ConsumeJobs(ctx context.Context, jobType string, processor func(JobMessage, int) error) error {
+// getSubmissionKey returns the key recording which Rev.ai job a transcription job was submitted as
+func (r *RedisConsumer) getSubmissionKey(jobID uuid.UUID) string {
+	return fmt.Sprintf("%s:revai:%s", r.prefix, jobID)
+}
+
+// GetSubmission returns the Rev.ai job ID a transcription job was previously submitted as, or an
+// empty string if it has not been submitted
+func (r *RedisConsumer) GetSubmission(ctx context.Context, jobID uuid.UUID) (string, error) {
+	revAIJobID, err := r.client.Get(ctx, r.getSubmissionKey(jobID)).Result()
+	if err == redis.Nil {
+		return "", nil
+	}
+	return revAIJobID, err
+}
+
+// SaveSubmission records the Rev.ai job ID a transcription job was submitted as
+func (r *RedisConsumer) SaveSubmission(ctx context.Context, jobID uuid.UUID, revAIJobID string) error {
+	return r.client.Set(ctx, r.getSubmissionKey(jobID), revAIJobID, submissionTTL).Err()
+}
+
+// ClearSubmission forgets the Rev.ai job a transcription job was submitted as
+func (r *RedisConsumer) ClearSubmission(ctx context.Context, jobID uuid.UUID) error {
+	return r.client.Del(ctx, r.getSubmissionKey(jobID)).Err()
+}
+
+// BatchSizes splits MaxConcurrentJobs between the configured number of Consumers, one batch size
+// per consumer to run. There are never more consumers than jobs, and the sizes add up to exactly
+// MaxConcurrentJobs, so running every consumer never exceeds it.
+func (r *RedisConsumer) BatchSizes() []int {
+	maxJobs := r.config.MaxConcurrentJobs
+	if maxJobs < 1 {
+		maxJobs = 1
+	}
+	consumers := r.config.Consumers
+	if consumers < 1 {
+		consumers = 1
+	}
+	if consumers > maxJobs {
+		consumers = maxJobs
+	}
+
+	sizes := make([]int, consumers)
+	for i := range sizes {
+		sizes[i] = maxJobs / consumers
+		if i < maxJobs%consumers {
+			sizes[i]++
+		}
+	}
+	return sizes
+}
+
+// ConsumeJobs starts consuming transcription jobs from the queue. Up to batchSize messages are
+// popped per round and handed to the processor together, which returns one error (or nil) per
+// message. It is safe to run several ConsumeJobs loops on one consumer.
+func (r *RedisConsumer) ConsumeJobs(ctx context.Context, jobType string, batchSize int, processor func([]JobMessage) []error) error {
 	queueName := r.getQueueName(jobType)
 	processingQueueName := r.getProcessingQueueName(jobType)
 	failedQueueName := r.getFailedQueueName(jobType)
 
-	log.Printf("Starting transcription consumer for queue: %s", queueName)
+	if batchSize < 1 {
+		batchSize = 1
+	}
+
+	log.Printf("Starting transcription consumer for queue: %s (batch size %d)", queueName, batchSize)
 
 	for {
 		// Check for context cancellation before each iteration
@@ -117,55 +177,80 @@ func (r *RedisConsumer) ConsumeJobs(ctx context.Context, jobType string, process
 			continue
 		}
 
-		// Parse job message
-		var message JobMessage
-		memberStr, ok := result.Member.(string)
-		if !ok {
-			log.Printf("Invalid member type in queue")
-			continue
+		// Drain whatever else is already waiting, without blocking, to fill the batch
+		members := []redis.Z{result.Z}
+		if batchSize > 1 {
+			more, err := r.client.ZPopMin(ctx, queueName, int64(batchSize-1)).Result()
+			if err != nil && err != redis.Nil {
+				log.Printf("Error getting additional jobs from queue: %v", err)
+			}
+			members = append(members, more...)
 		}
-		if err := json.Unmarshal([]byte(memberStr), &message); err != nil {
-			log.Printf("Error unmarshaling job message: %v", err)
-			continue
+
+		// Parse job messages
+		messages := make([]JobMessage, 0, len(members))
+		for _, member := range members {
+			var message JobMessage
+			memberStr, ok := member.Member.(string)
+			if !ok {
+				log.Printf("Invalid member type in queue")
+				continue
+			}
+			if err := json.Unmarshal([]byte(memberStr), &message); err != nil {
+				log.Printf("Error unmarshaling job message: %v", err)
+				continue
+			}
+			messages = append(messages, message)
 		}
 
-		log.Printf("Processing transcription job %s for audiobook %s", message.ID, message.AudiobookID)
+		if len(messages) == 0 {
+			continue
+		}
 
 		// Move to processing queue
-		processingBytes, _ := json.Marshal(message)
-		r.client.ZAdd(ctx, processingQueueName, redis.Z{
-			Score:  float64(time.Now().Unix()),
-			Member: processingBytes,
-		})
-
-		// Process the job
-		if err := processor(message, message.RetryCount); err != nil {
-			log.Printf("Error processing transcription job %s: %v", message.ID, err)
-
-			// Handle retry logic
-			if message.RetryCount < message.MaxRetries {
-				message.RetryCount++
-				message.Priority = 10 // Higher priority for retries
-
-				// Add back to main queue with delay
-				retryBytes, _ := json.Marshal(message)
-				score := float64(time.Now().Add(time.Duration(message.RetryCount*30) * time.Second).Unix())
-				r.client.ZAdd(ctx, queueName, redis.Z{
-					Score:  score,
-					Member: retryBytes,
-				})
-			} else {
-				// Move to failed queue
-				failedBytes, _ := json.Marshal(message)
-				r.client.ZAdd(ctx, failedQueueName, redis.Z{
-					Score:  float64(time.Now().Unix()),
-					Member: failedBytes,
-				})
-			}
+		processingMembers := make([][]byte, len(messages))
+		for i, message := range messages {
+			log.Printf("Processing transcription job %s for audiobook %s", message.ID, message.AudiobookID)
+
+			processingMembers[i], _ = json.Marshal(message)
+			r.client.ZAdd(ctx, processingQueueName, redis.Z{
+				Score:  float64(time.Now().Unix()),
+				Member: processingMembers[i],
+			})
 		}
 
-		// Remove from processing queue
-		r.client.ZRem(ctx, processingQueueName, processingBytes)
+		// Process the batch
+		errs := processor(messages)
+
+		for i, message := range messages {
+			if err := errs[i]; err != nil {
+				log.Printf("Error processing transcription job %s: %v", message.ID, err)
+
+				// Handle retry logic
+				if message.RetryCount < message.MaxRetries {
+					message.RetryCount++
+					message.Priority = 10 // Higher priority for retries
+
+					// Add back to main queue with delay
+					retryBytes, _ := json.Marshal(message)
+					score := float64(time.Now().Add(time.Duration(message.RetryCount*30) * time.Second).Unix())
+					r.client.ZAdd(ctx, queueName, redis.Z{
+						Score:  score,
+						Member: retryBytes,
+					})
+				} else {
+					// Move to failed queue
+					failedBytes, _ := json.Marshal(message)
+					r.client.ZAdd(ctx, failedQueueName, redis.Z{
+						Score:  float64(time.Now().Unix()),
+						Member: failedBytes,
+					})
+				}
+			}
+
+			// Remove from processing queue
+			r.client.ZRem(ctx, processingQueueName, processingMembers[i])
+		}
 	}
 }
 
@@ -0,0 +1,63 @@
+package services
+
+import (
+	"reflect"
+	"testing"
+)
+
+func TestBatchSizes(t *testing.T) {
+	tests := []struct {
+		name              string
+		maxConcurrentJobs int
+		consumers         int
+		expectedSizes     []int
+	}{
+		{
+			name:              "remainder goes to the first consumers",
+			maxConcurrentJobs: 5,
+			consumers:         3,
+			expectedSizes:     []int{2, 2, 1},
+		},
+		{
+			name:              "no more consumers than jobs",
+			maxConcurrentJobs: 1,
+			consumers:         3,
+			expectedSizes:     []int{1},
+		},
+		{
+			name:              "unset limits run a single job",
+			maxConcurrentJobs: 0,
+			consumers:         0,
+			expectedSizes:     []int{1},
+		},
+		{
+			name:              "uneven split between two consumers",
+			maxConcurrentJobs: 7,
+			consumers:         2,
+			expectedSizes:     []int{4, 3},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			consumer := &RedisConsumer{config: &Config{MaxConcurrentJobs: tt.maxConcurrentJobs, Consumers: tt.consumers}}
+
+			sizes := consumer.BatchSizes()
+			if !reflect.DeepEqual(sizes, tt.expectedSizes) {
+				t.Errorf("batch sizes = %v, want %v", sizes, tt.expectedSizes)
+			}
+
+			maxJobs := tt.maxConcurrentJobs
+			if maxJobs < 1 {
+				maxJobs = 1
+			}
+			total := 0
+			for _, size := range sizes {
+				total += size
+			}
+			if total != maxJobs {
+				t.Errorf("batch sizes add up to %d, want %d", total, maxJobs)
+			}
+		})
+	}
+}
@@ -3,58 +3,139 @@ package services
 import (
 	"bytes"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"io"
 	"log"
+	"mime/multipart"
 	"net/http"
+	"os"
+	"path/filepath"
+	"strings"
+	"sync"
 	"time"
 
 	"audio-book-ai/transcriber/models"
 )
 
+// Errors reported when Rev.ai finished a job without a transcript
+var (
+	ErrJobFailed   = errors.New("Rev.ai job failed")
+	ErrJobCanceled = errors.New("Rev.ai job was canceled")
+)
+
+// ErrJobUnavailable is reported when Rev.ai refuses to look up a job (401, 403 or 404), e.g. after
+// it was deleted or the API key or URL changed. Waiting longer cannot succeed.
+var ErrJobUnavailable = errors.New("Rev.ai job is unavailable")
+
+// callbackFallbackInterval is how often job status is still polled when completion callbacks are enabled
+const callbackFallbackInterval = 60 * time.Second
+
+// uploadTimeout bounds a local audio upload, which can take far longer than an API call for multi-hour files
+const uploadTimeout = 30 * time.Minute
+
+// minAudioFileSize is the smallest local file accepted for upload; anything shorter cannot hold audio
+const minAudioFileSize = 1 << 10
+
 // RevAIService handles Rev.ai API interactions
 type RevAIService struct {
-	apiKey  string
-	baseURL string
-	client  *http.Client
+	authHeader string
+	baseURL    string
+	options    RevAIOptions
+	client     *http.Client
+
+	// jobTemplate holds the submission options shared by every job
+	jobTemplate models.RevAIJob
+
+	uploadClient *http.Client
+
+	callbackMu sync.Mutex
+	callbacks  map[string]chan struct{}
+}
+
+// RevAIOptions holds the job options sent with every Rev.ai submission
+type RevAIOptions struct {
+	Transcriber string // Rev.ai model tier: "machine", "low_cost" or "fusion"
+	Language    string // ISO 639 language code of the audio
+	CallbackURL string // Public URL Rev.ai notifies on job completion; polling only when empty
+
+	// SkipDiarization drops Rev.ai's speaker diarization pass. Every segment is then
+	// attributed to speaker 0, which suits single-narrator audiobooks.
+	SkipDiarization bool
 }
 
 // NewRevAIService creates a new Rev.ai service
-func NewRevAIService(apiKey, baseURL string) *RevAIService {
+func NewRevAIService(apiKey, baseURL string, options RevAIOptions) *RevAIService {
+	// Only the media differs between submissions, so the rest of the job is set up once
+	jobTemplate := models.RevAIJob{
+		Metadata:        "Audio Book AI Transcription",
+		CallbackURL:     options.CallbackURL,
+		Transcriber:     options.Transcriber,
+		Language:        options.Language,
+		SkipDiarization: options.SkipDiarization,
+		// ProcessTranscript only keeps "text" elements, so punctuation would be discarded anyway
+		SkipPunctuation: true,
+	}
+
 	return &RevAIService{
-		apiKey:  apiKey,
-		baseURL: baseURL,
-		client: &http.Client{
-			Timeout: 30 * time.Second,
-		},
+		authHeader:  "Bearer " + apiKey,
+		baseURL:     baseURL,
+		options:     options,
+		client:      NewHTTPClient(30 * time.Second),
+		jobTemplate: jobTemplate,
+		callbacks:   make(map[string]chan struct{}),
+
+		uploadClient: NewHTTPClient(uploadTimeout),
 	}
 }
 
-// SubmitJob submits an audio file to Rev.ai for transcription
-func (r *RevAIService) SubmitJob(filePath string) (string, error) {
-	jobData := models.RevAIJob{
-		MediaURL: filePath, // This should be a publicly accessible URL
-		Metadata: "Audio Book AI Transcription",
+// WarmUp makes a cheap authenticated request so the first job does not pay for DNS lookup, TCP and
+// TLS setup, and an invalid API key is reported at startup rather than on the first job
+func (r *RevAIService) WarmUp() error {
+	req, err := http.NewRequest("GET", r.baseURL+"/account", nil)
+	if err != nil {
+		return fmt.Errorf("failed to create request: %v", err)
 	}
 
-	jsonData, err := json.Marshal(jobData)
+	req.Header.Set("Authorization", r.authHeader)
+
+	resp, err := r.client.Do(req)
 	if err != nil {
-		return "", fmt.Errorf("failed to marshal job data: %v", err)
+		return fmt.Errorf("failed to reach Rev.ai: %v", err)
 	}
+	defer CloseBody(resp.Body)
 
-	req, err := http.NewRequest("POST", r.baseURL+"/jobs", bytes.NewBuffer(jsonData))
+	if resp.StatusCode != http.StatusOK {
+		body, _ := io.ReadAll(resp.Body)
+		return fmt.Errorf("Rev.ai API error: %d - %s", resp.StatusCode, string(body))
+	}
+
+	return nil
+}
+
+// SubmitJob submits an audio file to Rev.ai for transcription. Rev.ai fetches https URLs itself;
+// local files are uploaded with the submission.
+func (r *RevAIService) SubmitJob(filePath string) (string, error) {
+	var req *http.Request
+	var err error
+	client := r.client
+	if strings.HasPrefix(filePath, "https://") {
+		req, err = r.newURLRequest(filePath)
+	} else {
+		req, err = r.newUploadRequest(filePath)
+		client = r.uploadClient
+	}
 	if err != nil {
-		return "", fmt.Errorf("failed to create request: %v", err)
+		return "", err
 	}
 
-	req.Header.Set("Authorization", "Bearer "+r.apiKey)
-	req.Header.Set("Content-Type", "application/json")
+	req.Header.Set("Authorization", r.authHeader)
 
-	resp, err := r.client.Do(req)
+	resp, err := client.Do(req)
 	if err != nil {
 		return "", fmt.Errorf("failed to submit job to Rev.ai: %v", err)
 	}
-	defer resp.Body.Close()
+	defer CloseBody(resp.Body)
 
 	if resp.StatusCode != http.StatusOK && resp.StatusCode != http.StatusCreated {
 		body, _ := io.ReadAll(resp.Body)
@@ -66,115 +147,379 @@ func (r *RevAIService) SubmitJob(filePath string) (string, error) {
 		return "", fmt.Errorf("failed to decode response: %v", err)
 	}
 
+	// Register for the completion callback straight away so an early notification is not missed
+	if r.options.CallbackURL != "" {
+		r.callbackMu.Lock()
+		r.callbacks[jobResp.ID] = make(chan struct{}, 1)
+		r.callbackMu.Unlock()
+	}
+
 	return jobResp.ID, nil
 }
 
-// WaitForJobCompletion waits for a Rev.ai job to complete
+// newURLRequest builds a JSON job submission for media Rev.ai can fetch itself
+func (r *RevAIService) newURLRequest(mediaURL string) (*http.Request, error) {
+	jobData := r.jobTemplate
+	jobData.MediaURL = mediaURL
+
+	jsonData, err := json.Marshal(jobData)
+	if err != nil {
+		return nil, fmt.Errorf("failed to marshal job data: %v", err)
+	}
+
+	req, err := http.NewRequest("POST", r.baseURL+"/jobs", bytes.NewReader(jsonData))
+	if err != nil {
+		return nil, fmt.Errorf("failed to create request: %v", err)
+	}
+	req.Header.Set("Content-Type", "application/json")
+
+	return req, nil
+}
+
+// newUploadRequest builds a multipart job submission for a local file. The file is validated with a
+// single open and stat, then streamed straight from disk behind the prebuilt form header, so
+// multi-hour audio is never held in memory or copied to a temporary file.
+func (r *RevAIService) newUploadRequest(filePath string) (*http.Request, error) {
+	options, err := json.Marshal(r.jobTemplate)
+	if err != nil {
+		return nil, fmt.Errorf("failed to marshal job data: %v", err)
+	}
+
+	file, size, err := openAudioFile(filePath)
+	if err != nil {
+		return nil, err
+	}
+
+	head, tail, boundary := buildUploadForm(options, filepath.Base(filePath))
+	body := struct {
+		io.Reader
+		io.Closer
+	}{io.MultiReader(bytes.NewReader(head), file, bytes.NewReader(tail)), file}
+
+	// The transport closes the body, and with it the file, once the request is done
+	req, err := http.NewRequest("POST", r.baseURL+"/jobs", body)
+	if err != nil {
+		file.Close()
+		return nil, fmt.Errorf("failed to create request: %v", err)
+	}
+	req.ContentLength = int64(len(head)) + size + int64(len(tail))
+	req.Header.Set("Content-Type", "multipart/form-data; boundary="+boundary)
+
+	return req, nil
+}
+
+// openAudioFile opens a local audio file for upload, rejecting anything that cannot be audio before
+// it reaches Rev.ai. The size comes from the same stat and sets the upload's Content-Length.
+func openAudioFile(filePath string) (*os.File, int64, error) {
+	file, err := os.Open(filePath)
+	if err != nil {
+		if os.IsNotExist(err) {
+			return nil, 0, fmt.Errorf("audio file not found: %s", filePath)
+		}
+		return nil, 0, fmt.Errorf("failed to open audio file: %v", err)
+	}
+
+	info, err := file.Stat()
+	if err != nil {
+		file.Close()
+		return nil, 0, fmt.Errorf("failed to stat audio file: %v", err)
+	}
+	if info.IsDir() {
+		file.Close()
+		return nil, 0, fmt.Errorf("audio file path is a directory: %s", filePath)
+	}
+	if info.Size() < minAudioFileSize {
+		file.Close()
+		return nil, 0, fmt.Errorf("audio file is too small (%d bytes): %s", info.Size(), filePath)
+	}
+
+	return file, info.Size(), nil
+}
+
+// buildUploadForm encodes everything in a Rev.ai upload except the audio itself: the options part
+// and media part header that precede it, and the closing boundary that follows it
+func buildUploadForm(options []byte, fileName string) (head, tail []byte, boundary string) {
+	var form bytes.Buffer
+	writer := multipart.NewWriter(&form)
+
+	// Writes to a bytes.Buffer cannot fail
+	writer.WriteField("options", string(options))
+	writer.CreateFormFile("media", fileName)
+	headLen := form.Len()
+	writer.Close()
+
+	return form.Bytes()[:headLen], form.Bytes()[headLen:], writer.Boundary()
+}
+
+// WaitForJobCompletion waits for a Rev.ai job to complete. When a callback URL is configured the
+// wait is woken by Rev.ai's completion callback and polling only runs as a slow safety net.
 func (r *RevAIService) WaitForJobCompletion(jobID string, maxRetries int) (*models.RevAITranscript, error) {
-	for i := 0; i < maxRetries; i++ {
-		req, err := http.NewRequest("GET", r.baseURL+"/jobs/"+jobID, nil)
-		if err != nil {
-			return nil, fmt.Errorf("failed to create request: %v", err)
+	pollInterval := 5 * time.Second
+	var notified chan struct{} // nil blocks forever, leaving only the poll interval
+	if r.options.CallbackURL != "" {
+		pollInterval = callbackFallbackInterval
+
+		r.callbackMu.Lock()
+		notified = r.callbacks[jobID]
+		if notified == nil {
+			notified = make(chan struct{}, 1)
+			r.callbacks[jobID] = notified
 		}
+		r.callbackMu.Unlock()
 
-		req.Header.Set("Authorization", "Bearer "+r.apiKey)
+		defer func() {
+			r.callbackMu.Lock()
+			delete(r.callbacks, jobID)
+			r.callbackMu.Unlock()
+		}()
+	}
 
-		resp, err := r.client.Do(req)
-		if err != nil {
+	// maxRetries is expressed in 5-second polling intervals
+	deadline := time.Now().Add(time.Duration(maxRetries) * 5 * time.Second)
+	for time.Now().Before(deadline) {
+		transcript, err := r.getJobDetails(jobID)
+		if errors.Is(err, ErrJobUnavailable) {
+			log.Printf("Job %s is no longer available: %v", jobID, err)
+			return nil, err
+		} else if err != nil {
 			log.Printf("Failed to check job status: %v", err)
-			time.Sleep(5 * time.Second)
-			continue
-		}
-		defer resp.Body.Close()
+		} else {
+			log.Printf("Job %s status: %s, waiting...", jobID, transcript.Status)
+
+			// Check for various completion statuses
+			if transcript.Status == "completed" || transcript.Status == "transcribed" || transcript.Status == "done" {
+				log.Printf("Job %s completed successfully with status: %s", jobID, transcript.Status)
+				return transcript, nil
+			} else if transcript.Status == "failed" || transcript.Status == "error" {
+				log.Printf("Job %s failed with status: %s", jobID, transcript.Status)
+				return nil, fmt.Errorf("%w with status: %s", ErrJobFailed, transcript.Status)
+			} else if transcript.Status == "canceled" || transcript.Status == "cancelled" {
+				log.Printf("Job %s was canceled with status: %s", jobID, transcript.Status)
+				return nil, fmt.Errorf("%w with status: %s", ErrJobCanceled, transcript.Status)
+			}
 
-		if resp.StatusCode != http.StatusOK {
-			log.Printf("Failed to get job status: %d", resp.StatusCode)
-			time.Sleep(5 * time.Second)
-			continue
+			// Log the current status for debugging
+			log.Printf("Job %s current status: %s", jobID, transcript.Status)
 		}
 
-		var transcript models.RevAITranscript
-		if err := json.NewDecoder(resp.Body).Decode(&transcript); err != nil {
-			log.Printf("Failed to decode response: %v", err)
-			time.Sleep(5 * time.Second)
-			continue
+		select {
+		case <-notified:
+			log.Printf("Received completion callback for Rev.ai job %s", jobID)
+		case <-time.After(pollInterval):
 		}
+	}
 
-		log.Printf("Job %s status: %s, waiting...", jobID, transcript.Status)
-
-		// Check for various completion statuses
-		if transcript.Status == "completed" || transcript.Status == "transcribed" || transcript.Status == "done" {
-			log.Printf("Job %s completed successfully with status: %s", jobID, transcript.Status)
-			return &transcript, nil
-		} else if transcript.Status == "failed" || transcript.Status == "error" {
-			log.Printf("Job %s failed with status: %s", jobID, transcript.Status)
-			return nil, fmt.Errorf("Rev.ai job failed with status: %s", transcript.Status)
-		} else if transcript.Status == "canceled" || transcript.Status == "cancelled" {
-			log.Printf("Job %s was canceled with status: %s", jobID, transcript.Status)
-			return nil, fmt.Errorf("Rev.ai job was canceled with status: %s", transcript.Status)
-		}
+	return nil, fmt.Errorf("job did not complete within timeout")
+}
 
-		// Log the current status for debugging
-		log.Printf("Job %s current status: %s, retry %d/%d", jobID, transcript.Status, i+1, maxRetries)
-		time.Sleep(5 * time.Second)
+// getJobDetails retrieves the current details of a Rev.ai job
+func (r *RevAIService) getJobDetails(jobID string) (*models.RevAITranscript, error) {
+	req, err := http.NewRequest("GET", r.baseURL+"/jobs/"+jobID, nil)
+	if err != nil {
+		return nil, fmt.Errorf("failed to create request: %v", err)
 	}
 
-	return nil, fmt.Errorf("job did not complete within timeout")
+	req.Header.Set("Authorization", r.authHeader)
+
+	resp, err := r.client.Do(req)
+	if err != nil {
+		return nil, fmt.Errorf("failed to get job status: %v", err)
+	}
+	defer CloseBody(resp.Body)
+
+	switch resp.StatusCode {
+	case http.StatusOK:
+	case http.StatusUnauthorized, http.StatusForbidden, http.StatusNotFound:
+		return nil, fmt.Errorf("%w: failed to get job status: %d", ErrJobUnavailable, resp.StatusCode)
+	default:
+		return nil, fmt.Errorf("failed to get job status: %d", resp.StatusCode)
+	}
+
+	var transcript models.RevAITranscript
+	if err := json.NewDecoder(resp.Body).Decode(&transcript); err != nil {
+		return nil, fmt.Errorf("failed to decode response: %v", err)
+	}
+
+	return &transcript, nil
+}
+
+// HandleCallback receives Rev.ai job completion callbacks and wakes the matching waiter.
+// The payload is only used as a signal; the job status is always re-read from the API.
+func (r *RevAIService) HandleCallback(w http.ResponseWriter, req *http.Request) {
+	if req.Method != http.MethodPost {
+		w.WriteHeader(http.StatusMethodNotAllowed)
+		return
+	}
+
+	var payload struct {
+		Job struct {
+			ID     string `json:"id"`
+			Status string `json:"status"`
+		} `json:"job"`
+	}
+	if err := json.NewDecoder(http.MaxBytesReader(w, req.Body, 1<<20)).Decode(&payload); err != nil {
+		log.Printf("Invalid Rev.ai callback payload: %v", err)
+		w.WriteHeader(http.StatusBadRequest)
+		return
+	}
+
+	r.callbackMu.Lock()
+	notified, ok := r.callbacks[payload.Job.ID]
+	r.callbackMu.Unlock()
+
+	if ok {
+		select {
+		case notified <- struct{}{}:
+		default:
+		}
+	} else {
+		log.Printf("Received callback for unknown Rev.ai job %s (status: %s)", payload.Job.ID, payload.Job.Status)
+	}
+
+	w.WriteHeader(http.StatusOK)
 }
 
-// GetTranscript retrieves the transcript from Rev.ai
-func (r *RevAIService) GetTranscript(jobID string) (*models.RevAITranscript, error) {
+// GetTranscript retrieves the transcript from Rev.ai and converts it into our format as it streams in
+func (r *RevAIService) GetTranscript(jobID string) (*models.Transcript, error) {
 	req, err := http.NewRequest("GET", r.baseURL+"/jobs/"+jobID+"/transcript", nil)
 	if err != nil {
 		return nil, fmt.Errorf("failed to create request: %v", err)
 	}
 
-	req.Header.Set("Authorization", "Bearer "+r.apiKey)
+	req.Header.Set("Authorization", r.authHeader)
 	req.Header.Set("Accept", "application/vnd.rev.transcript.v1.0+json")
 
 	resp, err := r.client.Do(req)
 	if err != nil {
 		return nil, fmt.Errorf("failed to get transcript: %v", err)
 	}
-	defer resp.Body.Close()
+	defer CloseBody(resp.Body)
 
 	if resp.StatusCode != http.StatusOK {
 		body, _ := io.ReadAll(resp.Body)
 		return nil, fmt.Errorf("failed to get transcript: %d - %s", resp.StatusCode, string(body))
 	}
 
-	var transcript models.RevAITranscript
-	if err := json.NewDecoder(resp.Body).Decode(&transcript); err != nil {
+	transcript, err := r.ProcessTranscript(resp.Body)
+	if err != nil {
 		return nil, fmt.Errorf("failed to decode transcript: %v", err)
 	}
 
-	return &transcript, nil
+	return transcript, nil
 }
 
-// ProcessTranscript processes the Rev.ai transcript into our format
-func (r *RevAIService) ProcessTranscript(revTranscript *models.RevAITranscript) *models.Transcript {
-	var content string
+// ProcessTranscript converts a Rev.ai transcript document into our format while reading it.
+// Elements are decoded one at a time, so the Rev.ai document is never held in memory
+// alongside the converted segments.
+func (r *RevAIService) ProcessTranscript(body io.Reader) (*models.Transcript, error) {
+	var content strings.Builder
 	var segments []models.Segment
 	var totalConfidence float64
 	var confidenceCount int
 
-	for _, monologue := range revTranscript.Monologues {
-		for _, element := range monologue.Elements {
-			if element.Type == "text" {
-				content += element.Value + " "
-
-				segment := models.Segment{
-					Start:      element.StartTs,
-					End:        element.EndTs,
-					Text:       element.Value,
-					Confidence: element.Confidence,
-					Speaker:    monologue.Speaker,
+	dec := json.NewDecoder(body)
+	document, err := openDelim(dec, '{')
+	if err != nil {
+		return nil, err
+	}
+
+	for document && dec.More() {
+		key, err := dec.Token()
+		if err != nil {
+			return nil, err
+		}
+		if key != "monologues" {
+			if err := skipValue(dec); err != nil {
+				return nil, err
+			}
+			continue
+		}
+
+		monologues, err := openDelim(dec, '[')
+		if err != nil {
+			return nil, err
+		}
+		if !monologues {
+			continue
+		}
+		for dec.More() {
+			monologue, err := openDelim(dec, '{')
+			if err != nil {
+				return nil, err
+			}
+			if !monologue {
+				continue
+			}
+
+			speaker := 0
+			first := len(segments)
+			for dec.More() {
+				key, err := dec.Token()
+				if err != nil {
+					return nil, err
 				}
-				segments = append(segments, segment)
 
-				totalConfidence += element.Confidence
-				confidenceCount++
+				switch key {
+				case "speaker":
+					if err := dec.Decode(&speaker); err != nil {
+						return nil, err
+					}
+				case "elements":
+					elements, err := openDelim(dec, '[')
+					if err != nil {
+						return nil, err
+					}
+					if !elements {
+						continue
+					}
+					for dec.More() {
+						var element models.RevAIElement
+						if err := dec.Decode(&element); err != nil {
+							return nil, err
+						}
+						if element.Type != "text" {
+							continue
+						}
+
+						content.WriteString(element.Value)
+						content.WriteByte(' ')
+
+						segments = append(segments, models.Segment{
+							Start:      element.StartTs,
+							End:        element.EndTs,
+							Text:       element.Value,
+							Confidence: element.Confidence,
+						})
+
+						totalConfidence += element.Confidence
+						confidenceCount++
+					}
+					if err := expectDelim(dec, ']'); err != nil {
+						return nil, err
+					}
+				default:
+					if err := skipValue(dec); err != nil {
+						return nil, err
+					}
+				}
+			}
+			if err := expectDelim(dec, '}'); err != nil {
+				return nil, err
 			}
+
+			// The speaker may follow the elements in the document, so it is applied once the monologue is read
+			for i := first; i < len(segments); i++ {
+				segments[i].Speaker = speaker
+			}
+		}
+		if err := expectDelim(dec, ']'); err != nil {
+			return nil, err
+		}
+	}
+
+	if document {
+		if err := expectDelim(dec, '}'); err != nil {
+			return nil, err
 		}
 	}
 
@@ -184,10 +529,44 @@ func (r *RevAIService) ProcessTranscript(revTranscript *models.RevAITranscript)
 	}
 
 	return &models.Transcript{
-		Content:               content,
+		Content:               content.String(),
 		Segments:              segments,
-		Language:              "en", // Rev.ai will detect language
+		Language:              r.options.Language, // Overridden by the job's language once known
 		ConfidenceScore:       avgConfidence,
 		ProcessingTimeSeconds: 0, // Will be set by caller
+	}, nil
+}
+
+// expectDelim reads the next JSON token and checks that it is the given delimiter
+func expectDelim(dec *json.Decoder, want json.Delim) error {
+	token, err := dec.Token()
+	if err != nil {
+		return err
 	}
+	if delim, ok := token.(json.Delim); !ok || delim != want {
+		return fmt.Errorf("unexpected token %v, expected %v", token, want)
+	}
+	return nil
+}
+
+// openDelim reads the opening delimiter of an object or array. A JSON null in its place is
+// accepted and reported as false, matching how encoding/json decodes null into a struct or slice.
+func openDelim(dec *json.Decoder, want json.Delim) (bool, error) {
+	token, err := dec.Token()
+	if err != nil {
+		return false, err
+	}
+	if token == nil {
+		return false, nil
+	}
+	if delim, ok := token.(json.Delim); !ok || delim != want {
+		return false, fmt.Errorf("unexpected token %v, expected %v", token, want)
+	}
+	return true, nil
+}
+
+// skipValue reads and discards the next JSON value
+func skipValue(dec *json.Decoder) error {
+	var value json.RawMessage
+	return dec.Decode(&value)
 }
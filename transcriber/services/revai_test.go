@@ -0,0 +1,343 @@
+package services
+
+import (
+	"bytes"
+	"encoding/json"
+	"errors"
+	"io"
+	"mime"
+	"mime/multipart"
+	"net/http"
+	"net/http/httptest"
+	"os"
+	"path/filepath"
+	"strings"
+	"sync/atomic"
+	"testing"
+	"time"
+)
+
+func TestProcessTranscript(t *testing.T) {
+	tests := []struct {
+		name               string
+		document           string
+		expectedContent    string
+		expectedSpeakers   []int
+		expectedConfidence float64
+		expectError        bool
+	}{
+		{
+			name: "speaker after elements is applied to the monologue",
+			document: `{"monologues":[
+				{"elements":[
+					{"type":"text","value":"Hello","start_ts":0.5,"end_ts":0.9,"confidence":0.8},
+					{"type":"text","value":"world","start_ts":1.0,"end_ts":1.4,"confidence":0.6}
+				],"speaker":2},
+				{"speaker":1,"elements":[{"type":"text","value":"Bye","start_ts":2.0,"end_ts":2.3,"confidence":1.0}]}
+			]}`,
+			expectedContent:    "Hello world Bye ",
+			expectedSpeakers:   []int{2, 2, 1},
+			expectedConfidence: 0.8,
+		},
+		{
+			name: "unknown keys are skipped",
+			document: `{"version":"1.0","monologues":[
+				{"speaker_info":{"id":0},"elements":[{"type":"text","value":"Hi","start_ts":0,"end_ts":1,"confidence":0.5,"extra":[1,2]}]}
+			],"metadata":null}`,
+			expectedContent:    "Hi ",
+			expectedSpeakers:   []int{0},
+			expectedConfidence: 0.5,
+		},
+		{
+			name: "punctuation elements are dropped",
+			document: `{"monologues":[{"elements":[
+				{"type":"text","value":"Hi","start_ts":0,"end_ts":1,"confidence":0.5},
+				{"type":"punct","value":"."},
+				{"type":"punct","value":" "}
+			]}]}`,
+			expectedContent:    "Hi ",
+			expectedSpeakers:   []int{0},
+			expectedConfidence: 0.5,
+		},
+		{
+			name:               "null monologues",
+			document:           `{"monologues":null}`,
+			expectedConfidence: 0.95,
+		},
+		{
+			name:               "null elements and null monologue",
+			document:           `{"monologues":[{"speaker":0,"elements":null},null]}`,
+			expectedConfidence: 0.95,
+		},
+		{
+			name:               "empty monologues and elements",
+			document:           `{"monologues":[{"elements":[]}]}`,
+			expectedConfidence: 0.95,
+		},
+		{
+			name:               "null document",
+			document:           `null`,
+			expectedConfidence: 0.95,
+		},
+		{
+			name:        "monologues of the wrong type",
+			document:    `{"monologues":{}}`,
+			expectError: true,
+		},
+		{
+			name:        "truncated document",
+			document:    `{"monologues":[{"elements":[`,
+			expectError: true,
+		},
+	}
+
+	service := NewRevAIService("test-key", "http://revai.invalid", RevAIOptions{Language: "en"})
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			transcript, err := service.ProcessTranscript(strings.NewReader(tt.document))
+			if tt.expectError {
+				if err == nil {
+					t.Fatal("expected an error, got nil")
+				}
+				return
+			}
+			if err != nil {
+				t.Fatalf("unexpected error: %v", err)
+			}
+
+			if transcript.Content != tt.expectedContent {
+				t.Errorf("content = %q, want %q", transcript.Content, tt.expectedContent)
+			}
+			if len(transcript.Segments) != len(tt.expectedSpeakers) {
+				t.Fatalf("got %d segments, want %d", len(transcript.Segments), len(tt.expectedSpeakers))
+			}
+			for i, speaker := range tt.expectedSpeakers {
+				if transcript.Segments[i].Speaker != speaker {
+					t.Errorf("segment %d speaker = %d, want %d", i, transcript.Segments[i].Speaker, speaker)
+				}
+			}
+			if diff := transcript.ConfidenceScore - tt.expectedConfidence; diff > 1e-6 || diff < -1e-6 {
+				t.Errorf("confidence = %v, want %v", transcript.ConfidenceScore, tt.expectedConfidence)
+			}
+			if transcript.Language != "en" {
+				t.Errorf("language = %q, want %q", transcript.Language, "en")
+			}
+		})
+	}
+}
+
+func TestWaitForJobCompletionUnavailable(t *testing.T) {
+	polls := 0
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		polls++
+		http.NotFound(w, r)
+	}))
+	defer server.Close()
+
+	service := NewRevAIService("test-key", server.URL, RevAIOptions{Language: "en"})
+
+	start := time.Now()
+	_, err := service.WaitForJobCompletion("deleted-job", 720)
+	if !errors.Is(err, ErrJobUnavailable) {
+		t.Fatalf("error = %v, want ErrJobUnavailable", err)
+	}
+	if elapsed := time.Since(start); elapsed > 2*time.Second {
+		t.Errorf("waited %v for a job Rev.ai no longer knows", elapsed)
+	}
+	if polls != 1 {
+		t.Errorf("polled %d times, want 1", polls)
+	}
+}
+
+func TestWaitForJobCompletionCallback(t *testing.T) {
+	var service *RevAIService
+	var polls atomic.Int32
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if polls.Add(1) > 1 {
+			w.Write([]byte(`{"id":"job-1","status":"transcribed"}`))
+			return
+		}
+
+		// The waiter is registered before its first poll, so Rev.ai's callback can arrive now
+		go func() {
+			callback := httptest.NewRequest(http.MethodPost, "/callbacks/revai", strings.NewReader(`{"job":{"id":"job-1","status":"transcribed"}}`))
+			service.HandleCallback(httptest.NewRecorder(), callback)
+		}()
+		w.Write([]byte(`{"id":"job-1","status":"in_progress"}`))
+	}))
+	defer server.Close()
+
+	service = NewRevAIService("test-key", server.URL, RevAIOptions{Language: "en", CallbackURL: "https://example.com/callbacks/revai"})
+
+	start := time.Now()
+	transcript, err := service.WaitForJobCompletion("job-1", 720)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if transcript.Status != "transcribed" {
+		t.Errorf("status = %q, want %q", transcript.Status, "transcribed")
+	}
+	if elapsed := time.Since(start); elapsed >= callbackFallbackInterval/2 {
+		t.Errorf("waited %v, the callback did not wake the waiter", elapsed)
+	}
+	if n := polls.Load(); n != 2 {
+		t.Errorf("polled %d times, want 2", n)
+	}
+}
+
+func TestHandleCallback(t *testing.T) {
+	tests := []struct {
+		name           string
+		method         string
+		body           string
+		expectedStatus int
+		expectWake     bool
+	}{
+		{
+			name:           "known job",
+			method:         http.MethodPost,
+			body:           `{"job":{"id":"job-1","status":"transcribed"}}`,
+			expectedStatus: http.StatusOK,
+			expectWake:     true,
+		},
+		{
+			name:           "unknown job is acknowledged",
+			method:         http.MethodPost,
+			body:           `{"job":{"id":"someone-else","status":"failed"}}`,
+			expectedStatus: http.StatusOK,
+		},
+		{
+			name:           "malformed payload",
+			method:         http.MethodPost,
+			body:           `{"job":`,
+			expectedStatus: http.StatusBadRequest,
+		},
+		{
+			name:           "wrong method",
+			method:         http.MethodGet,
+			expectedStatus: http.StatusMethodNotAllowed,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			service := NewRevAIService("test-key", "http://revai.invalid", RevAIOptions{Language: "en", CallbackURL: "https://example.com/callbacks/revai"})
+			notified := make(chan struct{}, 1)
+			service.callbacks["job-1"] = notified
+
+			recorder := httptest.NewRecorder()
+			service.HandleCallback(recorder, httptest.NewRequest(tt.method, "/callbacks/revai", strings.NewReader(tt.body)))
+
+			if recorder.Code != tt.expectedStatus {
+				t.Errorf("status = %d, want %d", recorder.Code, tt.expectedStatus)
+			}
+			if woken := len(notified) == 1; woken != tt.expectWake {
+				t.Errorf("waiter woken = %v, want %v", woken, tt.expectWake)
+			}
+		})
+	}
+}
+
+func TestOpenAudioFile(t *testing.T) {
+	dir := t.TempDir()
+	small := filepath.Join(dir, "small.mp3")
+	if err := os.WriteFile(small, make([]byte, minAudioFileSize-1), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	valid := filepath.Join(dir, "chapter.mp3")
+	if err := os.WriteFile(valid, make([]byte, minAudioFileSize), 0o644); err != nil {
+		t.Fatal(err)
+	}
+
+	tests := []struct {
+		name        string
+		path        string
+		expectError string
+	}{
+		{name: "valid file", path: valid},
+		{name: "file under 1KB", path: small, expectError: "too small"},
+		{name: "directory", path: dir, expectError: "is a directory"},
+		{name: "missing file", path: filepath.Join(dir, "missing.mp3"), expectError: "not found"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			file, size, err := openAudioFile(tt.path)
+			if tt.expectError != "" {
+				if err == nil || !strings.Contains(err.Error(), tt.expectError) {
+					t.Fatalf("error = %v, want one containing %q", err, tt.expectError)
+				}
+				return
+			}
+			if err != nil {
+				t.Fatalf("unexpected error: %v", err)
+			}
+			defer file.Close()
+			if size != minAudioFileSize {
+				t.Errorf("size = %d, want %d", size, minAudioFileSize)
+			}
+		})
+	}
+}
+
+func TestNewUploadRequest(t *testing.T) {
+	audio := bytes.Repeat([]byte("audio"), 1000)
+	path := filepath.Join(t.TempDir(), "chapter.mp3")
+	if err := os.WriteFile(path, audio, 0o644); err != nil {
+		t.Fatal(err)
+	}
+
+	service := NewRevAIService("test-key", "http://revai.invalid", RevAIOptions{Language: "en"})
+	req, err := service.newUploadRequest(path)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	defer req.Body.Close()
+
+	body, err := io.ReadAll(req.Body)
+	if err != nil {
+		t.Fatalf("failed to read body: %v", err)
+	}
+	if req.ContentLength != int64(len(body)) {
+		t.Errorf("Content-Length = %d, body has %d bytes", req.ContentLength, len(body))
+	}
+
+	mediaType, params, err := mime.ParseMediaType(req.Header.Get("Content-Type"))
+	if err != nil || mediaType != "multipart/form-data" {
+		t.Fatalf("Content-Type = %q (%v), want multipart/form-data", req.Header.Get("Content-Type"), err)
+	}
+
+	expectedOptions, err := json.Marshal(service.jobTemplate)
+	if err != nil {
+		t.Fatal(err)
+	}
+	expectedParts := []struct {
+		name    string
+		content []byte
+	}{
+		{"options", expectedOptions},
+		{"media", audio},
+	}
+
+	form := multipart.NewReader(bytes.NewReader(body), params["boundary"])
+	for _, expected := range expectedParts {
+		part, err := form.NextPart()
+		if err != nil {
+			t.Fatalf("expected part %q: %v", expected.name, err)
+		}
+		if part.FormName() != expected.name {
+			t.Errorf("part name = %q, want %q", part.FormName(), expected.name)
+		}
+		content, err := io.ReadAll(part)
+		if err != nil {
+			t.Fatalf("failed to read part %q: %v", expected.name, err)
+		}
+		if !bytes.Equal(content, expected.content) {
+			t.Errorf("part %q has %d bytes, not the expected %d", expected.name, len(content), len(expected.content))
+		}
+	}
+	if part, err := form.NextPart(); err != io.EOF {
+		t.Errorf("unexpected extra part %v (%v)", part, err)
+	}
+}
@@ -0,0 +1,200 @@
+package services
+
+import (
+	"bytes"
+	"encoding/json"
+	"fmt"
+	"log"
+	"net/http"
+	"time"
+)
+
+// maxStatusBatch caps how many queued status updates are sent to the API in one request
+const maxStatusBatch = 50
+
+// JobStatusUpdate is a job status change reported to the API
+type JobStatusUpdate struct {
+	JobID        string
+	Status       string
+	ErrorMessage string
+	StartedAt    *time.Time
+	CompletedAt  *time.Time
+	RetryCount   int
+}
+
+// StatusUpdater sends job status updates to the API from a background goroutine so job
+// processing never waits on the API round trip. Updates are delivered in the order they are queued.
+type StatusUpdater struct {
+	httpClient     *http.Client
+	apiBaseURL     string
+	internalAPIKey string
+	updates        chan JobStatusUpdate
+	done           chan struct{}
+}
+
+// NewStatusUpdater creates a status updater and starts its delivery goroutine
+func NewStatusUpdater(httpClient *http.Client, apiBaseURL, internalAPIKey string, queueSize int) *StatusUpdater {
+	s := &StatusUpdater{
+		httpClient:     httpClient,
+		apiBaseURL:     apiBaseURL,
+		internalAPIKey: internalAPIKey,
+		updates:        make(chan JobStatusUpdate, queueSize),
+		done:           make(chan struct{}),
+	}
+
+	go s.run()
+	return s
+}
+
+// Update queues a status update. It only blocks when the queue is full.
+func (s *StatusUpdater) Update(update JobStatusUpdate) {
+	s.updates <- update
+}
+
+// Close stops accepting updates and waits for the queued ones to be delivered
+func (s *StatusUpdater) Close() {
+	close(s.updates)
+	<-s.done
+}
+
+// run delivers queued updates until the updater is closed. Updates that are already waiting are
+// collected and sent in one request, so a finished batch of jobs costs a single API round trip.
+func (s *StatusUpdater) run() {
+	defer close(s.done)
+
+	for update := range s.updates {
+		batch := []JobStatusUpdate{update}
+
+	collect:
+		for len(batch) < maxStatusBatch {
+			select {
+			case next, ok := <-s.updates:
+				if !ok {
+					break collect
+				}
+				batch = append(batch, next)
+			default:
+				break collect
+			}
+		}
+
+		if len(batch) == 1 {
+			s.send(batch[0])
+		} else {
+			s.sendBatch(batch)
+		}
+	}
+}
+
+// send sends a job status update to the API
+func (s *StatusUpdater) send(update JobStatusUpdate) {
+	url := fmt.Sprintf("%s/api/v1/internal/jobs/%s/status", s.apiBaseURL, update.JobID)
+	if _, ok := s.post(url, update.payload(), nil); ok {
+		log.Printf("Job %s status updated successfully: %s", update.JobID, update.Status)
+	}
+}
+
+// sendBatch sends several job status updates to the API in one request
+func (s *StatusUpdater) sendBatch(batch []JobStatusUpdate) {
+	updates := make([]map[string]interface{}, len(batch))
+	for i, update := range batch {
+		updates[i] = update.payload()
+		updates[i]["job_id"] = update.JobID
+	}
+
+	// The API accepts the batch as a whole and reports each update's outcome in data
+	var response struct {
+		Data []struct {
+			JobID string `json:"job_id"`
+			Error string `json:"error"`
+		} `json:"data"`
+	}
+
+	url := fmt.Sprintf("%s/api/v1/internal/jobs/status", s.apiBaseURL)
+	status, ok := s.post(url, map[string]interface{}{"updates": updates}, &response)
+	if !ok {
+		// An API that rejects the batch, e.g. one deployed before the batch endpoint existed,
+		// still takes each update on its per-job endpoint
+		if status != 0 && (status < 200 || status >= 300) {
+			log.Printf("Batch status update rejected, sending %d updates individually", len(batch))
+			for _, update := range batch {
+				s.send(update)
+			}
+		}
+		return
+	}
+
+	failed := 0
+	for _, result := range response.Data {
+		if result.Error != "" {
+			failed++
+			log.Printf("Job %s status update failed: %s", result.JobID, result.Error)
+		}
+	}
+	log.Printf("Sent %d job status updates (%d failed)", len(batch), failed)
+}
+
+// post sends a JSON payload to the API and reports whether it was accepted, along with the HTTP
+// status of the reply (0 when no reply was received). When response is non-nil the API's JSON
+// reply is decoded into it.
+func (s *StatusUpdater) post(url string, payload interface{}, response interface{}) (int, bool) {
+	// Convert payload to JSON
+	jsonData, err := json.Marshal(payload)
+	if err != nil {
+		log.Printf("Error marshaling job status update: %v", err)
+		return 0, false
+	}
+
+	// Create HTTP request
+	req, err := http.NewRequest("POST", url, bytes.NewBuffer(jsonData))
+	if err != nil {
+		log.Printf("Error creating job status update request: %v", err)
+		return 0, false
+	}
+
+	req.Header.Set("Content-Type", "application/json")
+	req.Header.Set("X-Internal-API-Key", s.internalAPIKey)
+
+	// Send request
+	resp, err := s.httpClient.Do(req)
+	if err != nil {
+		log.Printf("Error sending job status update: %v", err)
+		return 0, false
+	}
+	defer CloseBody(resp.Body)
+
+	if resp.StatusCode != http.StatusOK {
+		log.Printf("Job status update failed with status: %d", resp.StatusCode)
+		return resp.StatusCode, false
+	}
+
+	if response != nil {
+		if err := json.NewDecoder(resp.Body).Decode(response); err != nil {
+			log.Printf("Error decoding job status update response: %v", err)
+			return resp.StatusCode, false
+		}
+	}
+	return resp.StatusCode, true
+}
+
+// payload builds the API request body for a status update
+func (u JobStatusUpdate) payload() map[string]interface{} {
+	payload := map[string]interface{}{
+		"status": u.Status,
+	}
+
+	if u.ErrorMessage != "" {
+		payload["error_message"] = u.ErrorMessage
+	}
+	if u.StartedAt != nil {
+		payload["started_at"] = u.StartedAt.Format(time.RFC3339)
+	}
+	if u.CompletedAt != nil {
+		payload["completed_at"] = u.CompletedAt.Format(time.RFC3339)
+	}
+	if u.RetryCount > 0 {
+		payload["retry_count"] = u.RetryCount
+	}
+
+	return payload
+}
@@ -0,0 +1,79 @@
+package services
+
+import (
+	"net/http"
+	"net/http/httptest"
+	"reflect"
+	"sync"
+	"testing"
+)
+
+func TestStatusUpdaterSendBatch(t *testing.T) {
+	tests := []struct {
+		name          string
+		batchStatus   int
+		expectedPaths []string
+	}{
+		{
+			name:        "accepted batch is sent once",
+			batchStatus: http.StatusOK,
+			expectedPaths: []string{
+				"/api/v1/internal/jobs/status",
+			},
+		},
+		{
+			name:        "API without the batch endpoint gets each update individually",
+			batchStatus: http.StatusNotFound,
+			expectedPaths: []string{
+				"/api/v1/internal/jobs/status",
+				"/api/v1/internal/jobs/job-1/status",
+				"/api/v1/internal/jobs/job-2/status",
+			},
+		},
+		{
+			name:        "rejected batch falls back to individual updates",
+			batchStatus: http.StatusInternalServerError,
+			expectedPaths: []string{
+				"/api/v1/internal/jobs/status",
+				"/api/v1/internal/jobs/job-1/status",
+				"/api/v1/internal/jobs/job-2/status",
+			},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			var mu sync.Mutex
+			var paths []string
+			server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+				mu.Lock()
+				paths = append(paths, r.URL.Path)
+				mu.Unlock()
+
+				if r.URL.Path == "/api/v1/internal/jobs/status" {
+					w.WriteHeader(tt.batchStatus)
+					if tt.batchStatus == http.StatusOK {
+						w.Write([]byte(`{"data":[{"job_id":"job-1","status":"completed"},{"job_id":"job-2","error":"Job not found"}]}`))
+					}
+					return
+				}
+				w.Write([]byte(`{}`))
+			}))
+			defer server.Close()
+
+			updater := &StatusUpdater{
+				httpClient:     server.Client(),
+				apiBaseURL:     server.URL,
+				internalAPIKey: "test-key",
+			}
+			updater.sendBatch([]JobStatusUpdate{
+				{JobID: "job-1", Status: "completed"},
+				{JobID: "job-2", Status: "failed", ErrorMessage: "Rev.ai job failed"},
+			})
+
+			if !reflect.DeepEqual(paths, tt.expectedPaths) {
+				t.Errorf("requested paths = %v, want %v", paths, tt.expectedPaths)
+			}
+		})
+	}
+}
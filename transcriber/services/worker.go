@@ -1,12 +1,13 @@
 package services
 
 import (
+	"context"
+	"errors"
 	"fmt"
 	"io"
 	"log"
 	"net/http"
-	"os"
-	"strings"
+	"sync"
 	"time"
 
 	"audio-book-ai/transcriber/models"
@@ -18,6 +19,7 @@ import (
 type Worker struct {
 	dbService      *DatabaseService
 	revAIService   *RevAIService
+	submissions    *RedisConsumer
 	config         *Config
 	apiBaseURL     string
 	internalAPIKey string
@@ -27,6 +29,7 @@ type Worker struct {
 // Config holds worker configuration
 type Config struct {
 	MaxConcurrentJobs int
+	Consumers         int
 	JobPollInterval   int
 	JobTimeout        int
 	APIBaseURL        string
@@ -34,98 +37,176 @@ type Config struct {
 }
 
 // NewWorker creates a new worker
-func NewWorker(dbService *DatabaseService, revAIService *RevAIService, config *Config) *Worker {
+func NewWorker(dbService *DatabaseService, revAIService *RevAIService, submissions *RedisConsumer, config *Config) *Worker {
 	return &Worker{
 		dbService:      dbService,
 		revAIService:   revAIService,
+		submissions:    submissions,
 		config:         config,
 		apiBaseURL:     config.APIBaseURL,
 		internalAPIKey: config.InternalAPIKey,
-		httpClient: &http.Client{
-			Timeout: 30 * time.Second,
-		},
+		httpClient:     NewHTTPClient(30 * time.Second),
 	}
 }
 
 // ProcessJob processes a single transcription job
 func (w *Worker) ProcessJob(job models.Job) error {
-	log.Printf("Processing transcription job %s for audiobook %s (retry %d/%d)", job.ID, job.AudiobookID, job.RetryCount, job.MaxRetries)
+	return w.ProcessJobs([]models.Job{job})[0]
+}
+
+// ProcessJobs processes a batch of transcription jobs and returns one error (or nil) per job.
+// Every job is submitted to Rev.ai before waiting on any of them so the files are transcribed
+// concurrently, and the resulting transcripts are saved in a single database round trip.
+func (w *Worker) ProcessJobs(jobs []models.Job) []error {
+	errs := make([]error, len(jobs))
+	revAIJobIDs := make([]string, len(jobs))
+	startTimes := make([]time.Time, len(jobs))
+
+	// Submit every job to Rev.ai up front
+	for i, job := range jobs {
+		log.Printf("Processing transcription job %s for audiobook %s (retry %d/%d)", job.ID, job.AudiobookID, job.RetryCount, job.MaxRetries)
+
+		// Check if we've exceeded max retries
+		if job.RetryCount >= job.MaxRetries {
+			errs[i] = fmt.Errorf("max retries exceeded for job %s", job.ID)
+			continue
+		}
 
-	// Check if we've exceeded max retries
-	if job.RetryCount >= job.MaxRetries {
-		return fmt.Errorf("max retries exceeded for job %s", job.ID)
+		// Supabase URLs are fetched by Rev.ai itself. Local paths are checked once, when the
+		// file is opened for upload, and rejected before anything is sent if missing or empty.
+		startTimes[i] = time.Now()
+		revAIJobID, err := w.submitAudio(job)
+		if err != nil {
+			errs[i] = fmt.Errorf("failed to transcribe audio: %v", err)
+			continue
+		}
+		revAIJobIDs[i] = revAIJobID
 	}
 
-	// Determine the file path to use for transcription
-	// If it's a Supabase URL, use it directly (Rev.ai can access it)
-	// If it's a local path, use the local path
-	transcriptionPath := job.FilePath
+	// Collect the transcripts as the Rev.ai jobs complete. Each job is collected on its own
+	// goroutine so downloading and decoding a finished transcript overlaps waiting on the others.
+	collected := make([]*models.Transcript, len(jobs))
+	var wg sync.WaitGroup
+	for i := range jobs {
+		if errs[i] != nil {
+			continue
+		}
 
-	// If it's a Supabase URL, we don't need to download it locally
-	// If it's a local path, we need to verify it exists
-	if !strings.HasPrefix(job.FilePath, "https://") {
-		// It's a local path, check if it exists
-		if _, err := os.Stat(job.FilePath); os.IsNotExist(err) {
-			return fmt.Errorf("audio file not found: %s", job.FilePath)
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+
+			transcript, err := w.collectTranscript(revAIJobIDs[i], startTimes[i])
+			if err != nil {
+				// A Rev.ai job that ended without a transcript, or that Rev.ai no longer
+				// knows, has to be resubmitted on retry
+				if errors.Is(err, ErrJobFailed) || errors.Is(err, ErrJobCanceled) || errors.Is(err, ErrJobUnavailable) {
+					w.forgetSubmission(jobs[i])
+				}
+				errs[i] = fmt.Errorf("failed to transcribe audio: %v", err)
+				return
+			}
+
+			// Set audiobook ID and file path
+			transcript.AudiobookID = jobs[i].AudiobookID
+			transcript.FilePath = jobs[i].FilePath
+			collected[i] = transcript
+		}(i)
+	}
+	wg.Wait()
+
+	var transcripts []*models.Transcript
+	var transcriptJobs []int
+	for i, transcript := range collected {
+		if transcript != nil {
+			transcripts = append(transcripts, transcript)
+			transcriptJobs = append(transcriptJobs, i)
 		}
 	}
 
-	// Transcribe audio
-	transcript, err := w.transcribeAudio(transcriptionPath)
-	if err != nil {
-		return fmt.Errorf("failed to transcribe audio: %v", err)
+	if len(transcripts) == 0 {
+		return errs
 	}
 
-	// Set audiobook ID, file path, and processing time
-	transcript.AudiobookID = job.AudiobookID
-	transcript.FilePath = job.FilePath
+	// Save all transcripts to the database at once
+	for n, err := range w.dbService.SaveTranscripts(transcripts) {
+		i := transcriptJobs[n]
+		if err != nil {
+			errs[i] = fmt.Errorf("failed to save transcript: %v", err)
+			continue
+		}
 
-	// Save transcript to database
-	if err := w.dbService.SaveTranscript(transcript); err != nil {
-		return fmt.Errorf("failed to save transcript: %v", err)
-	}
+		job := jobs[i]
+		w.forgetSubmission(job)
 
-	fmt.Printf("Checking if chapter %s is chapter 1\n", job.ChapterID)
+		fmt.Printf("Checking if chapter %s is chapter 1\n", job.ChapterID)
 
-	// Check if this is chapter 1 and trigger summarize/tag jobs immediately
-	if err := w.checkAndTriggerSummarizeTagJobsForChapter1(job.AudiobookID.String(), job.ChapterID); err != nil {
-		log.Printf("Warning: Failed to check/trigger summarize and tag jobs for chapter 1: %v", err)
-		// Don't fail the transcription job if this fails
+		// Check if this is chapter 1 and trigger summarize/tag jobs immediately
+		if err := w.checkAndTriggerSummarizeTagJobsForChapter1(job.AudiobookID.String(), job.ChapterID); err != nil {
+			log.Printf("Warning: Failed to check/trigger summarize and tag jobs for chapter 1: %v", err)
+			// Don't fail the transcription job if this fails
+		}
+
+		log.Printf("Successfully processed transcription job %s", job.ID)
 	}
 
-	log.Printf("Successfully processed transcription job %s", job.ID)
-	return nil
+	return errs
 }
 
-// transcribeAudio transcribes an audio file using Rev.ai
-func (w *Worker) transcribeAudio(filePath string) (*models.Transcript, error) {
-	startTime := time.Now()
+// submitAudio submits a job's audio file to Rev.ai and returns the Rev.ai job ID. A job that was
+// already submitted, by an earlier attempt or before a restart, reuses its existing Rev.ai job
+// instead of transcribing the file again.
+func (w *Worker) submitAudio(job models.Job) (string, error) {
+	revAIJobID, err := w.submissions.GetSubmission(context.Background(), job.ID)
+	if err != nil {
+		log.Printf("Warning: Failed to look up previous Rev.ai submission for job %s: %v", job.ID, err)
+	}
+	if revAIJobID != "" {
+		log.Printf("Resuming Rev.ai job %s for transcription job %s", revAIJobID, job.ID)
+		return revAIJobID, nil
+	}
 
-	// Submit job to Rev.ai
-	jobID, err := w.revAIService.SubmitJob(filePath)
+	revAIJobID, err = w.revAIService.SubmitJob(job.FilePath)
 	if err != nil {
-		return nil, fmt.Errorf("failed to submit to Rev.ai: %v", err)
+		return "", fmt.Errorf("failed to submit to Rev.ai: %v", err)
 	}
 
-	log.Printf("Submitted job to Rev.ai: %s", jobID)
+	log.Printf("Submitted job to Rev.ai: %s", revAIJobID)
 
+	if err := w.submissions.SaveSubmission(context.Background(), job.ID, revAIJobID); err != nil {
+		log.Printf("Warning: Failed to record Rev.ai submission for job %s: %v", job.ID, err)
+	}
+
+	return revAIJobID, nil
+}
+
+// forgetSubmission drops a job's recorded Rev.ai submission once it is no longer reusable
+func (w *Worker) forgetSubmission(job models.Job) {
+	if err := w.submissions.ClearSubmission(context.Background(), job.ID); err != nil {
+		log.Printf("Warning: Failed to clear Rev.ai submission for job %s: %v", job.ID, err)
+	}
+}
+
+// collectTranscript waits for a submitted Rev.ai job and converts its transcript to our format
+func (w *Worker) collectTranscript(jobID string, startTime time.Time) (*models.Transcript, error) {
 	// Wait for job completion
 	log.Printf("Waiting for Rev.ai job %s to complete (timeout: %d seconds)", jobID, w.config.JobTimeout/5)
-	_, err = w.revAIService.WaitForJobCompletion(jobID, w.config.JobTimeout/5) // 5-second intervals
+	jobDetails, err := w.revAIService.WaitForJobCompletion(jobID, w.config.JobTimeout/5) // 5-second intervals
 	if err != nil {
 		log.Printf("Rev.ai job %s failed to complete: %v", jobID, err)
-		return nil, fmt.Errorf("failed to wait for job completion: %v", err)
+		return nil, fmt.Errorf("failed to wait for job completion: %w", err)
 	}
 	log.Printf("Rev.ai job %s completed successfully", jobID)
 
 	// Get the transcript
-	transcript, err := w.revAIService.GetTranscript(jobID)
+	processedTranscript, err := w.revAIService.GetTranscript(jobID)
 	if err != nil {
 		return nil, fmt.Errorf("failed to get transcript: %v", err)
 	}
 
-	// Process the transcript
-	processedTranscript := w.revAIService.ProcessTranscript(transcript)
+	if jobDetails.Language != "" {
+		processedTranscript.Language = jobDetails.Language
+	}
 	processedTranscript.ProcessingTimeSeconds = int(time.Since(startTime).Seconds())
 
 	return processedTranscript, nil
@@ -167,7 +248,7 @@ func (w *Worker) checkAndTriggerSummarizeTagJobsForChapter1(audiobookID string,
 	if err != nil {
 		return fmt.Errorf("failed to call webhook: %v", err)
 	}
-	defer resp.Body.Close()
+	defer CloseBody(resp.Body)
 
 	// Read response body for better error reporting
 	body, _ := io.ReadAll(resp.Body)
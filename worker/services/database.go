@@ -163,7 +163,12 @@ func (d *DatabaseService) SaveAIOutput(output *models.AIOutput) error {
 // GetChapterTranscripts retrieves all chapter transcripts for an audiobook
 func (d *DatabaseService) GetChapterTranscripts(audiobookID uuid.UUID) ([]models.ChapterTranscript, error) {
 	query := `
-		SELECT ct.id, ct.chapter_id, ct.audiobook_id, ct.content, ct.segments, 
+		SELECT ct.id, ct.chapter_id, ct.audiobook_id, ct.content,
+		       (SELECT json_agg(json_build_object(
+		           'start', s.start_ts, 'end', s.end_ts, 'text', s.text,
+		           'confidence', s.confidence, 'speaker', s.speaker
+		       ) ORDER BY s.idx)
+		        FROM transcript_segments s WHERE s.chapter_id = ct.chapter_id) AS segments,
 		       ct.language, ct.confidence_score, ct.processing_time_seconds, ct.created_at
 		FROM chapter_transcripts ct
 		JOIN chapters c ON ct.chapter_id = c.id
@@ -232,7 +237,12 @@ func (d *DatabaseService) GetAllTags() ([]string, error) {
 // GetChapter1Transcript gets the transcript for chapter 1 of an audiobook
 func (d *DatabaseService) GetChapter1Transcript(audiobookID string) (*models.ChapterTranscript, error) {
 	query := `
-		SELECT ct.id, ct.chapter_id, ct.audiobook_id, ct.content, ct.segments, 
+		SELECT ct.id, ct.chapter_id, ct.audiobook_id, ct.content,
+		       (SELECT json_agg(json_build_object(
+		           'start', s.start_ts, 'end', s.end_ts, 'text', s.text,
+		           'confidence', s.confidence, 'speaker', s.speaker
+		       ) ORDER BY s.idx)
+		        FROM transcript_segments s WHERE s.chapter_id = ct.chapter_id) AS segments,
 		       ct.language, ct.confidence_score, ct.processing_time_seconds, ct.created_at
 		FROM chapter_transcripts ct
 		JOIN chapters c ON ct.chapter_id = c.id